@@ -3,67 +3,160 @@ User Management Utility
 Add new users to the Jira Extraction Tool
 """
 
+import argparse
+import csv
 import hashlib
+import mmap
 import os
+import re
+import secrets
 from pathlib import Path
+from typing import List, Set, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
+
+
+# Matches the numbered username keys written by add_user_to_env
+_USER_RE = re.compile(rb'^APP_USER_(\d+)_USERNAME=', re.M)
+
+# PBKDF2-HMAC-SHA256 work factor for new password hashes (auth.py imports
+# it too, so keep this module free of app dependencies)
+PBKDF2_ITERATIONS = 200_000
 
 
 def hash_password(password: str) -> str:
-    """Hash password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """
+    Hash password using salted PBKDF2-HMAC-SHA256
+    
+    Returns an ``iterations:salt:hash`` record (hex encoded) so the
+    verifier can reuse the same parameters.
+    """
+    salt = secrets.token_bytes(16)
+    derived = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PBKDF2_ITERATIONS)
+    return f"{PBKDF2_ITERATIONS}:{salt.hex()}:{derived.hex()}"
+
 
+def _used_user_numbers(env_content) -> Set[int]:
+    """User numbers already taken in a bytes-like .env buffer"""
+    return {int(m.group(1)) for m in _USER_RE.finditer(env_content)}
 
-def get_next_user_number(env_content: str) -> int:
-    """Find the next available user number"""
+
+def _lowest_free_number(used: Set[int]) -> int:
+    """Lowest user number not in used; AuthManager stops reading at the first gap"""
     user_num = 1
-    while f'APP_USER_{user_num}_USERNAME' in env_content:
+    while user_num in used:
         user_num += 1
     return user_num
 
 
-def add_user_to_env(username: str, password: str):
-    """Add a new user to the .env file"""
-    env_path = Path('.env')
+def get_next_user_number(env_content) -> int:
+    """Find the next available user number in a bytes-like .env buffer"""
+    return _lowest_free_number(_used_user_numbers(env_content))
+
+
+def ensure_env_file(env_path: Path) -> bool:
+    """Create .env from .env.example if it does not exist yet"""
+    if env_path.exists():
+        return True
     
-    if not env_path.exists():
-        print("⚠️  .env file not found. Creating from .env.example...")
-        example_path = Path('.env.example')
-        if example_path.exists():
-            with open(example_path, 'r') as f:
-                env_content = f.read()
-            with open(env_path, 'w') as f:
-                f.write(env_content)
+    print("⚠️  .env file not found. Creating from .env.example...")
+    example_path = Path('.env.example')
+    if example_path.exists():
+        with open(example_path, 'r') as f:
+            env_content = f.read()
+        with open(env_path, 'w') as f:
+            f.write(env_content)
+        return True
+    
+    print("❌ .env.example not found. Please create .env file manually.")
+    return False
+
+
+class EnvFile:
+    """
+    Read-only mapping of a .env file plus an append handle for new users
+    
+    The mapping stays open for the lifetime of the context so repeated
+    username checks reuse it; new entries are buffered and written with a
+    single append when the context exits without an error.
+    """
+    
+    def __init__(self, env_path: Path):
+        self.env_path = env_path
+        self._file = open(env_path, 'rb')
+        # mmap cannot map an empty file
+        if os.fstat(self._file.fileno()).st_size:
+            self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
         else:
-            print("❌ .env.example not found. Please create .env file manually.")
-            return False
+            self.mm = None
+        self._append = open(env_path, 'a')
+        self._used_nums = _used_user_numbers(self.mm) if self.mm is not None else set()
+        self._entries: List[str] = []
+        self._added: Set[str] = set()
     
-    # Read current .env content
-    with open(env_path, 'r') as f:
-        env_content = f.read()
+    def __enter__(self):
+        return self
     
-    # Check if username already exists
-    if f'USERNAME={username}' in env_content:
-        print(f"⚠️  Username '{username}' already exists in .env file!")
-        overwrite = input("Do you want to update the password? (yes/no): ").lower()
-        if overwrite != 'yes':
-            print("❌ User addition cancelled.")
-            return False
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and self._entries:
+                self._append.write(''.join(self._entries))
+                self._append.flush()
+        finally:
+            self._append.close()
+            if self.mm is not None:
+                self.mm.close()
+            self._file.close()
+        return False
     
-    # Generate password hash
-    password_hash = hash_password(password)
+    def username_exists(self, username: str) -> bool:
+        """Check the mapped file and the pending entries for an exact username"""
+        if username in self._added:
+            return True
+        if self.mm is None:
+            return False
+        # Whole-line match, so 'bob' is not found inside 'bobby'
+        pattern = rb'^APP_USER_\d+_USERNAME=' + re.escape(username.encode()) + rb'\r?$'
+        return re.search(pattern, self.mm, re.M) is not None
     
-    # Get next user number
-    user_num = get_next_user_number(env_content)
+    def add_user(self, username: str, password_hash: str) -> int:
+        """Queue a new user entry and return its user number"""
+        user_num = _lowest_free_number(self._used_nums)
+        self._entries.append(
+            f"\n# User {user_num}\n"
+            f"APP_USER_{user_num}_USERNAME={username}\n"
+            f"APP_USER_{user_num}_PASSWORD_HASH={password_hash}\n"
+        )
+        self._added.add(username)
+        self._used_nums.add(user_num)
+        return user_num
+
+
+def add_user_to_env(username: str, password: str):
+    """Add a new user to the .env file"""
+    env_path = Path('.env')
     
-    # Add new user to .env file
-    new_user_entry = f"""
-# User {user_num}
-APP_USER_{user_num}_USERNAME={username}
-APP_USER_{user_num}_PASSWORD_HASH={password_hash}
-"""
+    if not ensure_env_file(env_path):
+        return False
     
-    with open(env_path, 'a') as f:
-        f.write(new_user_entry)
+    with EnvFile(env_path) as env_file:
+        # Check if username already exists
+        if env_file.username_exists(username):
+            print(f"⚠️  Username '{username}' already exists in .env file!")
+            overwrite = input("Do you want to update the password? (yes/no): ").lower()
+            if overwrite != 'yes':
+                print("❌ User addition cancelled.")
+                return False
+        
+        # Generate password hash
+        password_hash = hash_password(password)
+        
+        # Add new user to .env file
+        user_num = env_file.add_user(username, password_hash)
     
     print(f"✅ User '{username}' added successfully!")
     print(f"   User Number: {user_num}")
@@ -73,6 +166,56 @@ APP_USER_{user_num}_PASSWORD_HASH={password_hash}
     return True
 
 
+def add_users_bulk(pairs: List[Tuple[str, str]]):
+    """
+    Add many users to the .env file in one pass
+    
+    The file is mapped once, all hashes are computed up front and the new
+    entries are written with a single append. Usernames that already exist
+    are skipped rather than prompting for each one.
+    """
+    env_path = Path('.env')
+    
+    if not ensure_env_file(env_path):
+        return False
+    
+    added = []
+    
+    with EnvFile(env_path) as env_file:
+        for username, password in pairs:
+            if env_file.username_exists(username):
+                print(f"⚠️  Username '{username}' already exists - skipped")
+                continue
+            
+            env_file.add_user(username, hash_password(password))
+            added.append(username)
+    
+    if not added:
+        print("❌ No new users to add.")
+        return False
+    
+    print(f"✅ Added {len(added)} user(s): {', '.join(added)}")
+    print("\n⚠️  Please restart the application for changes to take effect.")
+    
+    return True
+
+
+def read_users_csv(csv_path: str) -> List[Tuple[str, str]]:
+    """Read username,password rows from a CSV file (header row optional)"""
+    pairs = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            username, password = row[0].strip(), row[1].strip()
+            if not username or not password:
+                continue
+            if (username.lower(), password.lower()) == ('username', 'password'):
+                continue
+            pairs.append((username, password))
+    return pairs
+
+
 def add_user_to_secrets(username: str, password: str):
     """Add a new user to secrets.toml for Streamlit Cloud"""
     secrets_dir = Path('.streamlit')
@@ -86,49 +229,18 @@ def add_user_to_secrets(username: str, password: str):
     
     # Read or create secrets.toml
     if secrets_path.exists():
-        with open(secrets_path, 'r') as f:
+        with open(secrets_path, 'rb') as f:
             content = f.read()
     else:
-        content = ""
-    
-    # Check if [users] section exists
-    if '[users]' not in content:
-        content += "\n[users]\n"
-    
-    # Add user entry
-    user_entry = f'{username} = "{password_hash}"\n'
-    
-    # Insert after [users] section
-    lines = content.split('\n')
-    new_lines = []
-    in_users_section = False
-    user_added = False
-    
-    for line in lines:
-        if line.strip() == '[users]':
-            in_users_section = True
-            new_lines.append(line)
-        elif in_users_section and line.startswith('['):
-            # New section starting, add user before it
-            if not user_added:
-                new_lines.append(user_entry)
-                user_added = True
-            in_users_section = False
-            new_lines.append(line)
-        elif in_users_section and f'{username} =' in line:
-            # User already exists, replace
-            new_lines.append(user_entry.strip())
-            user_added = True
-        else:
-            new_lines.append(line)
+        content = b""
     
-    # If still in users section at end of file, add user
-    if in_users_section and not user_added:
-        new_lines.append(user_entry.strip())
+    # Add or replace the user entry in the [users] table
+    data = tomllib.loads(content.decode('utf-8')) if content else {}
+    data.setdefault('users', {})[username] = password_hash
     
     # Write back to file
-    with open(secrets_path, 'w') as f:
-        f.write('\n'.join(new_lines))
+    with open(secrets_path, 'wb') as f:
+        f.write(tomli_w.dumps(data).encode('utf-8'))
     
     print(f"✅ User '{username}' added to secrets.toml!")
     print(f"   Password Hash: {password_hash}")
@@ -137,11 +249,25 @@ def add_user_to_secrets(username: str, password: str):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Add users to the Jira Extraction Tool")
+    parser.add_argument(
+        '--csv',
+        metavar='PATH',
+        help="Add all users from a CSV file of username,password rows to .env"
+    )
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("  Jira Extraction Tool - User Management")
     print("=" * 60)
     print()
     
+    if args.csv:
+        add_users_bulk(read_users_csv(args.csv))
+        print()
+        print("=" * 60)
+        return
+    
     # Get user input
     username = input("Enter username: ").strip()
     if not username:
@@ -7,13 +7,17 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
+from typing import Optional, Sequence, Tuple, TYPE_CHECKING
 
 # Local imports
 from auth import auth_manager
 from config import config_manager
 from jira_client import JiraClient, JiraAPIError
 from data_processor import DataProcessor
-from utils import setup_logging, InputValidator, ValidationError, DataExporter, ExportError
+from utils import setup_logging, InputValidator, ValidationError
+
+if TYPE_CHECKING:
+    from utils import DataExporter
 
 # Setup logging
 setup_logging(log_level="INFO", log_to_file=True)
@@ -27,8 +31,32 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Hidden helper column used by the issues table search
+SEARCH_COLUMN = '_search_blob'
+
+# High-cardinality text columns stored as Arrow-backed strings
+ARROW_STRING_COLUMNS = ('Issue key', 'Summary', 'Issue URL', 'Epic/Story', 'Epic URL')
+
+# Columns shown in the issues table, in display order
+TABLE_COLUMN_ORDER = [
+    'Epic URL', 'Issue URL', 'Summary', 'Reporter',
+    'Priority', 'QA Status', 'Created Date', 'Comments'
+]
+
+# Issue type quick-select presets; "All Types" uses the project's issue types
+PRESET_ALL = "📊 All Types"
+PRESET_CUSTOM = "🎯 Custom Selection"
+PRESET_ISSUE_TYPES = {
+    "🐛 Bugs Only": ("Bug",),
+    "📝 Tasks with 'Clarification'": ("Task",),
+}
+PRESET_KEYS = (*PRESET_ISSUE_TYPES, PRESET_ALL, PRESET_CUSTOM)
+
+# LinkColumn display_text pattern: show the issue key from a /browse/ URL
+JIRA_KEY_FROM_URL = r"^.*/browse/(.*)$"
+
 # Enhanced Custom CSS
-st.markdown("""
+APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -80,15 +108,21 @@ st.markdown("""
         background-color: #F4F5F7;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Whitespace-collapsed once at import to keep the per-rerun element small
+APP_CSS = " ".join(APP_CSS.split())
+
+# Streamlit drops elements that are not re-emitted, so the styles are sent every run
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 
 def initialize_session_state():
     """Initialize Streamlit session state"""
     if 'data' not in st.session_state:
         st.session_state.data = None
-    if 'filtered_data' not in st.session_state:
-        st.session_state.filtered_data = None
+    if 'stats' not in st.session_state:
+        st.session_state.stats = None
     if 'config_loaded' not in st.session_state:
         st.session_state.config_loaded = False
 
@@ -207,11 +241,54 @@ def render_header():
     st.divider()
 
 
+@st.cache_resource
+def _get_processor() -> DataProcessor:
+    """Shared DataProcessor instance, constructed once per process"""
+    return DataProcessor()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_jira_client(cloud_id: str, project_key: str, base_url: str, email: str, api_token: str) -> JiraClient:
+    """
+    Shared JiraClient per configuration, constructed once per process
+    
+    Reusing the client keeps its session's pooled keep-alive connections
+    warm across reruns instead of reconnecting after every interaction.
+    """
+    return JiraClient(
+        cloud_id=cloud_id,
+        project_key=project_key,
+        base_url=base_url,
+        email=email,
+        api_token=api_token
+    )
+
+
+@st.cache_resource
+def _get_exporter() -> "DataExporter":
+    """Shared DataExporter instance, constructed once per process"""
+    from utils import DataExporter
+    return DataExporter()
+
+
+def clear_metadata_cache(jira_client: JiraClient):
+    """Drop cached Jira metadata so the next render refetches it"""
+    jira_client.invalidate_cache()
+
+
+def _as_sorted_tuple(values: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Normalise a multiselect value to a sorted tuple (empty when unset)"""
+    return tuple(sorted(values)) if values else ()
+
+
 def render_sidebar(jira_client: JiraClient):
     """Render enhanced sidebar with all filters"""
     with st.sidebar:
         st.header("🔍 Filters")
         
+        if st.button("🔄 Refresh metadata", use_container_width=True, help="Reload issue types, statuses, priorities and users from Jira"):
+            clear_metadata_cache(jira_client)
+        
         # Predefined QA reporters (fallback if not found in Jira)
         QA_REPORTERS = [
             "Chinthaka Somarathna",
@@ -221,183 +298,172 @@ def render_sidebar(jira_client: JiraClient):
             "Ushan Jayakody"
         ]
         
-        # Fetch all project users for reporter filter
-        # Cache this in session state to avoid repeated API calls
-        if 'all_project_users' not in st.session_state:
-            with st.spinner("Loading project users from Jira..."):
-                st.session_state.all_project_users = jira_client.get_project_users()
-                logger.info(f"Loaded {len(st.session_state.all_project_users)} users from Jira: {st.session_state.all_project_users}")
-        
-        all_project_users = st.session_state.all_project_users
-        
-        # Issue Type Selection
-        st.subheader("📋 Issue Type")
-        available_issue_types = jira_client.get_issue_types()
-        
-        preset_options = {
-            "🐛 Bugs Only": ["Bug"],
-            "📝 Tasks with 'Clarification'": ["Task"],
-            "📊 All Types": available_issue_types,
-            "🎯 Custom Selection": []
-        }
+        # Fetch project metadata for the filters; the shared client caches the
+        # lookups per TTL and never caches its fallback lists after a failure
+        with st.spinner("Loading project metadata from Jira..."):
+            reference_data = jira_client.get_reference_data_concurrent()
+        all_project_users = reference_data['users']
         
+        # These three decide which inputs the form shows, so they sit outside
+        # it and redraw the form straight away; nothing is applied until the
+        # form is submitted, when they are read together with its values
+        st.subheader("🧭 Filter Modes")
         preset = st.selectbox(
-            "Quick Select",
-            options=list(preset_options.keys()),
+            "📋 Issue Type Preset",
+            options=PRESET_KEYS,
             help="Choose a preset or select Custom"
         )
-        
-        if preset == "🎯 Custom Selection":
-            selected_issue_types = st.multiselect(
-                "Select Issue Types",
-                options=available_issue_types,
-                default=["Bug", "Task"]
-            )
-        else:
-            selected_issue_types = preset_options[preset]
-            st.info(f"✓ {', '.join(selected_issue_types)}")
-        
-        # Special filter to include only clarification tasks
-        filter_clarifications = st.checkbox(
-            "📌 Filter: Title contains 'Clarification'",
-            value=False,
-            help="Apply special filter: status IN ('01_To Do', 'To Do', 'Ready For Dev') AND type = Task AND summary ~ 'clarification'"
-        )
-        
-        st.divider()
-        
-        # Custom Summary Search (available for all presets)
-        st.subheader("🔎 Summary Search")
-        summary_search_text = st.text_input(
-            "Search in Summary",
-            value="",
-            placeholder="Enter text to search in issue summaries...",
-            help="Search for issues containing this text in their summary (case-insensitive)"
-        )
-        
-        st.divider()
-        
-        # Status Selection
-        st.subheader("🎯 Status")
-        available_statuses = jira_client.get_statuses()
-        selected_statuses = st.multiselect(
-            "Select Statuses",
-            options=available_statuses,
-            default=["To Do", "Ready for Dev"],
-            help="Select one or more statuses"
-        )
-        
-        st.divider()
-        
-        # Priority Selection
-        st.subheader("⚡ Priority")
-        available_priorities = jira_client.get_priorities()
-        selected_priorities = st.multiselect(
-            "Select Priorities",
-            options=available_priorities,
-            default=["P0", "P1", "P2"],
-            help="Select one or more priorities"
-        )
-        
-        st.divider()
-        
-        # Reporter Filter (NEW)
-        st.subheader("👥 Reporter")
         reporter_filter_type = st.radio(
-            "Reporter Filter",
+            "👥 Reporter Filter",
             options=["All Reporters", "QA Team Only", "Custom Selection"],
             help="Filter by issue reporter"
         )
-        
-        if reporter_filter_type == "QA Team Only":
-            selected_reporters = QA_REPORTERS
-            st.success(f"✓ {len(QA_REPORTERS)} QA team members")
-            with st.expander("👥 QA Team Members"):
-                for member in QA_REPORTERS:
-                    in_jira = "✅" if member in all_project_users else "⚠️ (not in Jira)"
-                    st.caption(f"{in_jira} {member}")
-        elif reporter_filter_type == "Custom Selection":
-            selected_reporters = st.multiselect(
-                "Select Reporters",
-                options=all_project_users,
-                help="Select specific reporters from all project users"
-            )
-            if selected_reporters:
-                st.info(f"✓ {len(selected_reporters)} reporter(s) selected")
-        else:
-            selected_reporters = None
-            st.info(f"📊 All reporters ({len(all_project_users)} total)")
-        
-        st.divider()
-        
-        # Date Range Filter (NEW)
-        st.subheader("📅 Created Date Range")
-        use_date_filter = st.checkbox("Enable date filtering", value=False)
-        
-        start_date = None
-        end_date = None
-        
-        if use_date_filter:
-            col1, col2 = st.columns(2)
-            with col1:
-                start_date_input = st.date_input(
-                    "From",
-                    value=datetime.now() - timedelta(days=30),
-                    help="Start date (inclusive)"
+        use_date_filter = st.checkbox("📅 Enable created date filtering", value=False)
+        
+        # Filters only apply on submit, so typing or dragging a slider
+        # does not rerun the whole script for every change
+        with st.form("filters_form", clear_on_submit=False):
+            # Issue Type Selection
+            st.subheader("📋 Issue Type")
+            available_issue_types = reference_data['issue_types']
+            
+            if preset == PRESET_CUSTOM:
+                selected_issue_types = st.multiselect(
+                    "Select Issue Types",
+                    options=available_issue_types,
+                    default=["Bug", "Task"]
                 )
-                start_date = start_date_input.strftime('%Y-%m-%d')
+            else:
+                selected_issue_types = PRESET_ISSUE_TYPES.get(preset, available_issue_types)
+                st.info(f"✓ {', '.join(selected_issue_types)}")
+            
+            # Special filter to include only clarification tasks
+            filter_clarifications = st.checkbox(
+                "📌 Filter: Title contains 'Clarification'",
+                value=False,
+                help="Apply special filter: status IN ('01_To Do', 'To Do', 'Ready For Dev') AND type = Task AND summary ~ 'clarification'"
+            )
+            
+            st.divider()
+            
+            # Custom Summary Search (available for all presets)
+            st.subheader("🔎 Summary Search")
+            summary_search_text = st.text_input(
+                "Search in Summary",
+                value="",
+                placeholder="Enter text to search in issue summaries...",
+                help="Search for issues containing this text in their summary (case-insensitive)"
+            )
+            
+            st.divider()
+            
+            # Status Selection
+            st.subheader("🎯 Status")
+            available_statuses = reference_data['statuses']
+            selected_statuses = st.multiselect(
+                "Select Statuses",
+                options=available_statuses,
+                default=["To Do", "Ready for Dev"],
+                help="Select one or more statuses"
+            )
+            
+            st.divider()
+            
+            # Priority Selection
+            st.subheader("⚡ Priority")
+            available_priorities = reference_data['priorities']
+            selected_priorities = st.multiselect(
+                "Select Priorities",
+                options=available_priorities,
+                default=["P0", "P1", "P2"],
+                help="Select one or more priorities"
+            )
+            
+            st.divider()
             
-            with col2:
-                end_date_input = st.date_input(
-                    "To",
-                    value=datetime.now(),
-                    help="End date (inclusive)"
+            # Reporter Filter (NEW)
+            st.subheader("👥 Reporter")
+            if reporter_filter_type == "QA Team Only":
+                selected_reporters = QA_REPORTERS
+                st.success(f"✓ {len(QA_REPORTERS)} QA team members")
+                with st.expander("👥 QA Team Members"):
+                    for member in QA_REPORTERS:
+                        in_jira = "✅" if member in all_project_users else "⚠️ (not in Jira)"
+                        st.caption(f"{in_jira} {member}")
+            elif reporter_filter_type == "Custom Selection":
+                selected_reporters = st.multiselect(
+                    "Select Reporters",
+                    options=all_project_users,
+                    help="Select specific reporters from all project users"
                 )
-                end_date = end_date_input.strftime('%Y-%m-%d')
+                if selected_reporters:
+                    st.info(f"✓ {len(selected_reporters)} reporter(s) selected")
+            else:
+                selected_reporters = None
+                st.info(f"📊 All reporters ({len(all_project_users)} total)")
             
-            st.caption(f"📆 {start_date} to {end_date}")
-        
-        st.divider()
-        
-        # Sprint Filter
-        st.subheader("🏃 Sprint")
-        filter_no_sprint = st.checkbox(
-            "Only issues without Sprint",
-            value=True,
-            help="Filter issues that have no sprint assigned"
-        )
-        
-        st.divider()
-        
-        # Max Results
-        max_results = st.slider(
-            "📊 Max Results",
-            min_value=10,
-            max_value=500,
-            value=100,
-            step=10,
-            help="Maximum number of issues to retrieve"
-        )
+            st.divider()
+            
+            # Date Range Filter (NEW)
+            st.subheader("📅 Created Date Range")
+            start_date = None
+            end_date = None
+            
+            if use_date_filter:
+                col1, col2 = st.columns(2)
+                with col1:
+                    start_date_input = st.date_input(
+                        "From",
+                        value=datetime.now() - timedelta(days=30),
+                        help="Start date (inclusive)"
+                    )
+                    start_date = start_date_input.strftime('%Y-%m-%d')
+            
+                with col2:
+                    end_date_input = st.date_input(
+                        "To",
+                        value=datetime.now(),
+                        help="End date (inclusive)"
+                    )
+                    end_date = end_date_input.strftime('%Y-%m-%d')
+            
+                st.caption(f"📆 {start_date} to {end_date}")
+            
+            st.divider()
+            
+            # Sprint Filter
+            st.subheader("🏃 Sprint")
+            filter_no_sprint = st.checkbox(
+                "Only issues without Sprint",
+                value=True,
+                help="Filter issues that have no sprint assigned"
+            )
+            
+            st.divider()
+            
+            # Max Results
+            max_results = st.slider(
+                "📊 Max Results",
+                min_value=10,
+                max_value=500,
+                value=100,
+                step=10,
+                help="Maximum number of issues to retrieve"
+            )
+            
+            st.divider()
+            
+            submitted = st.form_submit_button("Apply filters", type="primary", use_container_width=True)
         
         st.divider()
         
-        # Filter Summary
-        with st.expander("📋 Filter Summary"):
-            st.markdown(f"""
-            - **Issue Types**: {len(selected_issue_types)}
-            - **Statuses**: {len(selected_statuses)}
-            - **Priorities**: {len(selected_priorities)}
-            - **Reporters**: {len(selected_reporters) if selected_reporters else 'All'}
-            - **Date Range**: {'Enabled' if use_date_filter else 'Disabled'}
-            - **Sprint Filter**: {'Yes' if filter_no_sprint else 'No'}
-            - **Summary Search**: {'Yes' if summary_search_text else 'No'}
-            """)
-        
-        return {
-            'issue_types': selected_issue_types,
-            'statuses': selected_statuses,
-            'priorities': selected_priorities,
-            'reporters': selected_reporters,
+        # List selections become sorted tuples so equal selections compare,
+        # hash and build JQL identically whatever order they were picked in
+        filters = {
+            'issue_types': _as_sorted_tuple(selected_issue_types),
+            'statuses': _as_sorted_tuple(selected_statuses),
+            'priorities': _as_sorted_tuple(selected_priorities),
+            'reporters': _as_sorted_tuple(selected_reporters),
             'start_date': start_date,
             'end_date': end_date,
             'filter_no_sprint': filter_no_sprint,
@@ -405,54 +471,129 @@ def render_sidebar(jira_client: JiraClient):
             'summary_search': summary_search_text.strip() if summary_search_text else None,
             'max_results': max_results
         }
+        
+        # An empty custom selection would otherwise mean every reporter
+        if submitted and reporter_filter_type == "Custom Selection" and not selected_reporters:
+            st.warning("Select at least one reporter, or choose All Reporters")
+            submitted = False
+        
+        if submitted or 'last_filters' not in st.session_state:
+            st.session_state.last_filters = filters
+        
+        render_filter_summary(st.session_state.last_filters)
+        
+        return st.session_state.last_filters
+
+
+@st.fragment
+def render_filter_summary(filters: dict):
+    """
+    Summarise the applied filters in the sidebar
+    
+    The details are only built while the toggle is on, and flipping it
+    reruns just this fragment.
+    """
+    with st.expander("📋 Filter Summary"):
+        if st.toggle("Show details", key="_show_filter_summary"):
+            st.markdown(f"""
+            - **Issue Types**: {len(filters['issue_types'])}
+            - **Statuses**: {len(filters['statuses'])}
+            - **Priorities**: {len(filters['priorities'])}
+            - **Reporters**: {len(filters['reporters']) if filters['reporters'] else 'All'}
+            - **Date Range**: {'Enabled' if filters['start_date'] else 'Disabled'}
+            - **Sprint Filter**: {'Yes' if filters['filter_no_sprint'] else 'No'}
+            - **Summary Search**: {'Yes' if filters['summary_search'] else 'No'}
+            """)
+
+
+def _filters_cache_key(filters: dict) -> tuple:
+    """Turn the filters dict into a hashable, order-independent cache key"""
+    return tuple(sorted(filters.items()))
+
 
+# Issue search results are reused for identical filters for a few minutes;
+# each entry holds a full DataFrame, so only the most recent ones are kept
+ISSUES_CACHE_TTL = 300
+ISSUES_CACHE_MAX_ENTRIES = 32
 
-def fetch_data(jira_client: JiraClient, filters: dict, base_url: str):
+
+@st.cache_data(ttl=ISSUES_CACHE_TTL, max_entries=ISSUES_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_issues_cached(filters_key: tuple, base_url: str, project_key: str, _client: JiraClient):
+    """
+    Query Jira and build the issues DataFrame, cached per project and filter set
+    
+    Returns (df, issue_count); df is None when Jira returned no issues.
+    """
+    filters = dict(filters_key)
+    
+    # Match reporters by account ID, which is unambiguous where display names
+    # are not. Jira fails the whole query on a user it cannot resolve, so if
+    # any name is unknown (e.g. a QA member not in the project) the reporter
+    # filter is applied to the results instead
+    reporters = None
+    if filters['reporters']:
+        reporters = _client.resolve_reporters(filters['reporters'])
+    
+    issues = _client.search_issues(
+        issue_types=list(filters['issue_types']),
+        statuses=list(filters['statuses']),
+        priorities=list(filters['priorities']),
+        include_sprint_filter=filters['filter_no_sprint'],
+        filter_clarifications=filters['filter_clarifications'],
+        summary_search=filters.get('summary_search'),
+        reporters=reporters,
+        start_date=filters['start_date'],
+        end_date=filters['end_date'],
+        max_results=filters['max_results'],
+        fields=list(DataProcessor.REQUIRED_FIELDS)
+    )
+    
+    if not issues:
+        return None, 0
+    
+    # Process to DataFrame
+    # Clarification, date and (resolved) reporter filters are applied at JQL level
+    processor = _get_processor()
+    df = processor.issues_to_dataframe(issues, base_url=base_url)
+    
+    if filters['reporters'] and reporters is None:
+        df = processor.filter_dataframe(df, reporters=list(filters['reporters']))
+    
+    if not df.empty:
+        # Free-text columns live in contiguous Arrow buffers rather than
+        # one Python object per cell
+        for col in ARROW_STRING_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('string[pyarrow]')
+        
+        # Lowercased key + summary column so the table search is one substring scan
+        df[SEARCH_COLUMN] = df['Issue key'].str.lower() + ' ' + df['Summary'].str.lower()
+    
+    return df, len(issues)
+
+
+def fetch_data(jira_client: JiraClient, filters: dict, base_url: str, force_refresh: bool = False):
     """Fetch data from Jira with enhanced progress tracking"""
     progress_bar = st.progress(0, text="Initializing...")
     
     try:
         progress_bar.progress(10, text="🔄 Connecting to Jira...")
         
-        # Fetch issues
-        issues = jira_client.search_issues(
-            issue_types=filters['issue_types'],
-            statuses=filters['statuses'],
-            priorities=filters['priorities'],
-            include_sprint_filter=filters['filter_no_sprint'],
-            filter_clarifications=filters['filter_clarifications'],
-            summary_search=filters.get('summary_search'),
-            max_results=filters['max_results']
-        )
+        # Fetch and process issues (served from cache for repeated filters);
+        # a forced refresh drops this entry so the new result replaces it
+        cache_args = (_filters_cache_key(filters), base_url, jira_client.project_key, jira_client)
+        if force_refresh:
+            _fetch_issues_cached.clear(*cache_args)
+        df, issue_count = _fetch_issues_cached(*cache_args)
         
-        progress_bar.progress(50, text="📦 Processing data...")
+        progress_bar.progress(75, text="🔍 Applying filters...")
         
-        if not issues:
+        if not issue_count:
             progress_bar.empty()
             st.warning("⚠️ No issues found matching the criteria")
             st.info("💡 **Tip:** Try adjusting your filters or check if the project has issues matching your criteria.")
             return None
         
-        # Process to DataFrame
-        processor = DataProcessor()
-        df = processor.issues_to_dataframe(issues, base_url=base_url)
-        
-        progress_bar.progress(75, text="🔍 Applying filters...")
-        
-        # Clarification filter is now applied at JQL level, no need for client-side filtering
-        
-        # Apply reporter filter
-        if filters['reporters']:
-            df = processor.filter_dataframe(df, reporters=filters['reporters'])
-        
-        # Apply date filter
-        if filters['start_date'] or filters['end_date']:
-            df = processor.filter_dataframe(
-                df,
-                start_date=filters['start_date'],
-                end_date=filters['end_date']
-            )
-        
         if df.empty:
             progress_bar.empty()
             st.warning("⚠️ No issues found after applying filters")
@@ -462,7 +603,8 @@ def fetch_data(jira_client: JiraClient, filters: dict, base_url: str):
         progress_bar.progress(100, text="✅ Complete!")
         
         st.session_state.data = df
-        st.session_state.filtered_data = df
+        # Summary statistics only change with the data, so compute them once here
+        st.session_state.stats = _get_processor().get_summary_stats(df)
         
         st.success(f"✅ Successfully fetched **{len(df)}** issues")
         logger.info(f"Fetched {len(df)} issues from Jira")
@@ -482,10 +624,11 @@ def fetch_data(jira_client: JiraClient, filters: dict, base_url: str):
         return None
 
 
-def render_summary_stats(df: pd.DataFrame):
-    """Render enhanced summary statistics"""
-    processor = DataProcessor()
-    stats = processor.get_summary_stats(df)
+def render_summary_stats(stats: dict):
+    """Render enhanced summary statistics computed at fetch time"""
+    priority_counts = stats['by_priority'].head(10)
+    status_counts = stats['by_status'].head(10)
+    reporter_counts = stats['by_reporter'].head(10)
     
     st.subheader("📈 Summary Statistics")
     
@@ -495,21 +638,19 @@ def render_summary_stats(df: pd.DataFrame):
         st.metric("📊 Total Issues", stats['total_issues'])
     
     with col2:
-        if stats['by_priority']:
-            top_priority = max(stats['by_priority'].items(), key=lambda x: x[1])
-            st.metric("⚡ Top Priority", f"{top_priority[0]}", f"{top_priority[1]} issues")
+        if not priority_counts.empty:
+            st.metric("⚡ Top Priority", f"{priority_counts.index[0]}", f"{priority_counts.iloc[0]} issues")
     
     with col3:
-        if stats['by_status']:
-            top_status = max(stats['by_status'].items(), key=lambda x: x[1])
-            st.metric("🎯 Top Status", f"{top_status[0]}", f"{top_status[1]} issues")
+        if not status_counts.empty:
+            st.metric("🎯 Top Status", f"{status_counts.index[0]}", f"{status_counts.iloc[0]} issues")
     
     with col4:
-        if stats['by_reporter']:
-            top_reporter = max(stats['by_reporter'].items(), key=lambda x: x[1])
+        if not reporter_counts.empty:
+            top_reporter = reporter_counts.index[0]
             # Shorten name if too long
-            reporter_name = top_reporter[0].split()[0] if ' ' in top_reporter[0] else top_reporter[0]
-            st.metric("👤 Top Reporter", reporter_name, f"{top_reporter[1]} issues")
+            reporter_name = top_reporter.split()[0] if ' ' in top_reporter else top_reporter
+            st.metric("👤 Top Reporter", reporter_name, f"{reporter_counts.iloc[0]} issues")
     
     # Detailed breakdown
     with st.expander("📊 Detailed Breakdown"):
@@ -517,34 +658,25 @@ def render_summary_stats(df: pd.DataFrame):
         
         with col1:
             st.write("**By Priority:**")
-            if stats['by_priority']:
-                priority_df = pd.DataFrame(
-                    list(stats['by_priority'].items()),
-                    columns=['Priority', 'Count']
-                ).sort_values('Count', ascending=False)
+            if not priority_counts.empty:
+                priority_df = priority_counts.rename_axis('Priority').reset_index(name='Count')
                 st.dataframe(priority_df, hide_index=True, use_container_width=True)
         
         with col2:
             st.write("**By Status:**")
-            if stats['by_status']:
-                status_df = pd.DataFrame(
-                    list(stats['by_status'].items()),
-                    columns=['Status', 'Count']
-                ).sort_values('Count', ascending=False)
+            if not status_counts.empty:
+                status_df = status_counts.rename_axis('Status').reset_index(name='Count')
                 st.dataframe(status_df, hide_index=True, use_container_width=True)
         
         with col3:
             st.write("**By Reporter:**")
-            if stats['by_reporter']:
-                reporter_df = pd.DataFrame(
-                    list(stats['by_reporter'].items()),
-                    columns=['Reporter', 'Count']
-                ).sort_values('Count', ascending=False).head(10)
+            if not reporter_counts.empty:
+                reporter_df = reporter_counts.rename_axis('Reporter').reset_index(name='Count')
                 st.dataframe(reporter_df, hide_index=True, use_container_width=True)
 
 
-def render_data_table(df: pd.DataFrame):
-    """Render interactive data table"""
+def render_data_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Render interactive data table and return the rows matching the search"""
     st.subheader("📋 Issues")
     
     # Search functionality
@@ -555,51 +687,110 @@ def render_data_table(df: pd.DataFrame):
     )
     
     if search_term:
-        processor = DataProcessor()
-        filtered_df = processor.filter_dataframe(df, search_term=search_term)
+        # One literal substring scan over the Arrow string column
+        mask = df[SEARCH_COLUMN].str.contains(search_term.lower(), regex=False, na=False)
+        filtered_df = df[mask.to_numpy(dtype=bool)]
         st.info(f"Showing **{len(filtered_df)}** of **{len(df)}** issues")
     else:
         filtered_df = df
     
-    st.session_state.filtered_data = filtered_df
-    
-    # Prepare display DataFrame (hide URL columns)
-    display_df = filtered_df.copy()
-    url_columns_to_hide = []
-    if 'Issue URL' in display_df.columns:
-        url_columns_to_hide.append('Issue URL')
-    if 'Epic URL' in display_df.columns:
-        url_columns_to_hide.append('Epic URL')
-    
-    if url_columns_to_hide:
-        display_df = display_df.drop(columns=url_columns_to_hide)
-    
-    # Display dataframe with enhanced column config
+    # Display dataframe with enhanced column config; the key columns are shown
+    # through their URL columns as links, and column_order hides the rest
     st.dataframe(
-        display_df,
+        filtered_df,
         use_container_width=True,
         hide_index=True,
+        column_order=TABLE_COLUMN_ORDER,
         column_config={
-            "Epic/Story": st.column_config.TextColumn("Epic/Story", width="small"),
-            "Issue key": st.column_config.TextColumn("Issue Key", width="small"),
+            "Epic URL": st.column_config.LinkColumn(
+                "Epic/Story", display_text=JIRA_KEY_FROM_URL, width="small", help="Open in Jira"
+            ),
+            "Issue URL": st.column_config.LinkColumn(
+                "Issue Key", display_text=JIRA_KEY_FROM_URL, width="small", help="Open in Jira"
+            ),
             "Priority": st.column_config.TextColumn("Priority", width="small"),
             "QA Status": st.column_config.TextColumn("Status", width="medium"),
             "Reporter": st.column_config.TextColumn("Reporter", width="medium"),
-            "Created Date": st.column_config.TextColumn("Created", width="small"),
+            "Created Date": st.column_config.DateColumn("Created", format="YYYY-MM-DD", width="small"),
             "Summary": st.column_config.TextColumn("Summary", width="large"),
         }
     )
+    
+    return filtered_df
+
+
+@st.fragment
+def render_results(df: pd.DataFrame):
+    """
+    Render the issues table and export section as one fragment
+    
+    Typing in the search box reruns only this fragment, so the summary
+    statistics and sidebar are not rebuilt, while the export buttons stay
+    in sync with the searched rows.
+    """
+    filtered_df = render_data_table(df)
+    st.divider()
+    render_export_section(filtered_df)
+
+
+@st.cache_data(show_spinner=False)
+def _build_excel(df: pd.DataFrame, sheet_name: str) -> bytes:
+    """Serialise the Excel export once per DataFrame content and sheet name"""
+    excel_buffer = _get_exporter().to_excel(df, sheet_name=sheet_name, include_timestamp=False)
+    return excel_buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _build_csv(df: pd.DataFrame) -> bytes:
+    """Serialise the CSV export once per DataFrame content"""
+    return _get_exporter().to_csv_bytes(df)
 
 
-def render_export_section():
-    """Render enhanced export functionality"""
+def _report_export_errors(build, errors: dict):
+    """
+    Wrap an export builder for a download button's deferred data callable
+    
+    The callable runs on its own thread after the click, where Streamlit
+    commands are ignored, so an ExportError is parked in errors (a dict kept
+    in session state) for the next rerun to show, then re-raised so the
+    download itself fails instead of saving an empty file.
+    """
+    def build_or_report(*args) -> bytes:
+        from utils import ExportError
+        try:
+            return build(*args)
+        except ExportError as e:
+            errors['message'] = str(e)
+            raise
+    return build_or_report
+
+
+def render_export_section(df: pd.DataFrame):
+    """
+    Render enhanced export functionality for the given rows
+    
+    Files are built only when a download button is clicked, so reruns that
+    don't download anything never serialise the data.
+    """
     st.subheader("💾 Export Data")
     
-    if st.session_state.filtered_data is None or st.session_state.filtered_data.empty:
+    # Failures from the last download click, reported here on the next rerun
+    export_errors = st.session_state.setdefault('export_errors', {})
+    if 'message' in export_errors:
+        st.error(f"Export error: {export_errors.pop('message')}")
+    
+    if df is None or df.empty:
         st.info("ℹ️ No data available to export. Please fetch data first.")
         return
     
-    df = st.session_state.filtered_data
+    df = df.drop(columns=[SEARCH_COLUMN], errors='ignore')
+    exporter = _get_exporter()
+    build_excel = _report_export_errors(_build_excel, export_errors)
+    build_csv = _report_export_errors(_build_csv, export_errors)
+    
+    # One timestamp for the sheet name, so it matches the file names' date
+    # even when the click comes after midnight
+    sheet_name = datetime.now().strftime('%Y-%m-%d')
     
     st.markdown(f"**Ready to export {len(df)} issues**")
     
@@ -607,60 +798,41 @@ def render_export_section():
     
     with col1:
         # Excel export with clickable links
-        try:
-            exporter = DataExporter()
-            excel_buffer = exporter.to_excel(
-                df,
-                sheet_name=datetime.now().strftime('%Y-%m-%d'),
-                include_timestamp=False
-            )
-            
-            filename = exporter.get_filename(
-                base_name="QA_Refinement_Session",
-                extension=".xlsx",
-                include_timestamp=True
-            )
-            
-            st.download_button(
-                label="📥 Download Excel (with clickable links)",
-                data=excel_buffer,
-                file_name=filename,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True,
-                type="primary"
-            )
-            st.caption("✨ Epic/Story and Issue keys are clickable Jira links")
-        except ExportError as e:
-            st.error(f"Export error: {str(e)}")
+        filename = exporter.get_filename(
+            base_name="QA_Refinement_Session",
+            extension=".xlsx",
+            include_timestamp=True
+        )
+        
+        st.download_button(
+            label="📥 Download Excel (with clickable links)",
+            data=lambda: build_excel(df, sheet_name),
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True,
+            type="primary"
+        )
+        st.caption("✨ Epic/Story and Issue keys are clickable Jira links")
     
     with col2:
         # CSV export
-        try:
-            exporter = DataExporter()
-            # Remove URL columns for CSV as it can't have hyperlinks
-            csv_df = df.copy()
-            url_columns = ['Issue URL', 'Epic URL']
-            existing_url_columns = [col for col in url_columns if col in csv_df.columns]
-            if existing_url_columns:
-                csv_df = csv_df.drop(columns=existing_url_columns)
-            csv_string = exporter.to_csv(csv_df)
-            
-            filename = exporter.get_filename(
-                base_name="QA_Refinement_Session",
-                extension=".csv",
-                include_timestamp=True
-            )
-            
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv_string,
-                file_name=filename,
-                mime="text/csv",
-                use_container_width=True
-            )
-            st.caption("📄 Plain text format")
-        except ExportError as e:
-            st.error(f"Export error: {str(e)}")
+        # Remove URL columns for CSV as it can't have hyperlinks
+        csv_df = df.drop(columns=['Issue URL', 'Epic URL'], errors='ignore')
+        
+        filename = exporter.get_filename(
+            base_name="QA_Refinement_Session",
+            extension=".csv",
+            include_timestamp=True
+        )
+        
+        st.download_button(
+            label="📥 Download CSV",
+            data=lambda: build_csv(csv_df),
+            file_name=filename,
+            mime="text/csv",
+            use_container_width=True
+        )
+        st.caption("📄 Plain text format")
 
 
 def main():
@@ -679,12 +851,12 @@ def main():
     config = load_configuration()
     
     # Initialize Jira client
-    jira_client = JiraClient(
-        cloud_id=config.cloud_id,
-        project_key=config.project_key,
-        base_url=config.base_url,
-        email=config.email,
-        api_token=config.api_token
+    jira_client = _get_jira_client(
+        config.cloud_id,
+        config.project_key,
+        config.base_url,
+        config.email,
+        config.api_token
     )
     
     # Sidebar filters
@@ -697,24 +869,28 @@ def main():
         st.subheader(f"📁 Project: Intellisight Plus ({config.project_key})")
     
     with col2:
-        if st.button("🔄 Fetch Data", type="primary", use_container_width=True):
-            df = fetch_data(jira_client, filters, config.base_url)
+        fetch_clicked = st.button("🔄 Fetch Data", type="primary", use_container_width=True)
+        force_refresh = st.checkbox(
+            "Force refresh",
+            value=False,
+            help="Ignore cached results and query Jira again"
+        )
+        if fetch_clicked:
+            df = fetch_data(jira_client, filters, config.base_url, force_refresh=force_refresh)
     
     # Display data if available
     if st.session_state.data is not None:
         st.divider()
-        render_summary_stats(st.session_state.data)
-        st.divider()
-        render_data_table(st.session_state.data)
+        render_summary_stats(st.session_state.stats)
         st.divider()
-        render_export_section()
+        render_results(st.session_state.data)
     else:
         # Show helpful getting started info
         st.markdown("""
         <div class="info-box">
             <h3>👋 Getting Started</h3>
             <ol>
-                <li>Configure your <strong>filters</strong> in the sidebar</li>
+                <li>Configure your <strong>filters</strong> in the sidebar and click <strong>Apply filters</strong></li>
                 <li>Click <strong>"🔄 Fetch Data"</strong> to retrieve issues</li>
                 <li>Review the results and statistics</li>
                 <li>Export to <strong>Excel</strong> (with clickable links) or <strong>CSV</strong></li>
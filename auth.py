@@ -5,28 +5,79 @@ Handles user login and session management
 
 import streamlit as st
 import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta
 import logging
 
+from add_user import PBKDF2_ITERATIONS
+from config import load_dotenv_once
+
 logger = logging.getLogger(__name__)
 
+# Fallback hash for the default admin/admin login, computed once at import
+_DEFAULT_ADMIN_HASH = hashlib.sha256(b'admin').hexdigest()
+
+# Salt for the throwaway derivation verify_password runs for legacy records
+_DUMMY_SALT = bytes(16)
+
+# Checked for unknown usernames so they cost the same PBKDF2 work as a
+# wrong password for a real user (same format and work factor as add_user.py)
+_DUMMY_HASH = f"{PBKDF2_ITERATIONS}:{_DUMMY_SALT.hex()}:{'00' * 32}"
+
 
 class AuthManager:
     """Manages user authentication and sessions"""
     
+    __slots__ = ('session_timeout', '_users_cache')
+    
     def __init__(self):
         self.session_timeout = 3600  # 1 hour in seconds
+        self._users_cache = None  # parsed users, filled on first get_users()
         
     def hash_password(self, password: str) -> str:
         """Hash password using SHA-256"""
         return hashlib.sha256(password.encode()).hexdigest()
     
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """
+        Check a password against a stored hash
+        Accepts PBKDF2 records (iterations:salt:hash) written by add_user.py
+        and legacy unsalted SHA-256 hex digests
+        
+        Every record, including legacy and malformed ones, costs exactly one
+        PBKDF2 derivation, so timing does not reveal which kind of hash a user
+        has or (via _DUMMY_HASH) whether the user exists at all.
+        """
+        iterations, salt, expected, legacy = PBKDF2_ITERATIONS, _DUMMY_SALT, None, None
+        try:
+            if ':' in stored_hash:
+                rounds, salt_hex, expected_hex = stored_hash.split(':', 2)
+                iterations, salt, expected = int(rounds), bytes.fromhex(salt_hex), bytes.fromhex(expected_hex)
+            else:
+                legacy = bytes.fromhex(stored_hash)
+        except ValueError:
+            pass  # malformed: still pay for the derivation below, then never match
+        
+        # Digests are compared as raw bytes in constant time
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+        if expected is not None:
+            return hmac.compare_digest(derived, expected)
+        if legacy is not None:
+            return hmac.compare_digest(hashlib.sha256(password.encode()).digest(), legacy)
+        return False
+    
     def get_users(self) -> dict:
         """
         Get all valid users and their password hashes
         Returns dict with username as key and password_hash as value
+        
+        The result is cached on the instance; call clear_users_cache() to
+        pick up changes to secrets or .env without restarting.
         """
+        if self._users_cache is not None:
+            return self._users_cache
+        
         users = {}
         
         try:
@@ -36,12 +87,11 @@ class AuthManager:
             elif hasattr(st, 'secrets') and 'auth' in st.secrets:
                 # Single user from old format (backward compatibility)
                 username = st.secrets['auth'].get('username', 'admin')
-                password_hash = st.secrets['auth'].get('password_hash', self.hash_password('admin'))
+                password_hash = st.secrets['auth'].get('password_hash', _DEFAULT_ADMIN_HASH)
                 users[username] = password_hash
             else:
                 # Load from environment file
-                from dotenv import load_dotenv
-                load_dotenv()
+                load_dotenv_once()
                 
                 # Try loading multiple users from USER_1, USER_2, etc.
                 user_index = 1
@@ -61,16 +111,22 @@ class AuthManager:
                 # If no users found with new format, try old single-user format (backward compatibility)
                 if not users:
                     username = os.getenv('APP_USERNAME', 'admin')
-                    password_hash = os.getenv('APP_PASSWORD_HASH', self.hash_password('admin'))
+                    password_hash = os.getenv('APP_PASSWORD_HASH', _DEFAULT_ADMIN_HASH)
                     users[username] = password_hash
+            
+            self._users_cache = users
                     
         except Exception as e:
             logger.error(f"Error loading users: {str(e)}")
-            # Fallback to default admin user
-            users['admin'] = self.hash_password('admin')
+            # Fallback to default admin user (not cached, so the next call retries)
+            users['admin'] = _DEFAULT_ADMIN_HASH
         
         return users
     
+    def clear_users_cache(self):
+        """Forget the cached users so the next lookup reloads them"""
+        self._users_cache = None
+    
     def verify_credentials(self, username: str, password: str) -> bool:
         """
         Verify user credentials against stored users
@@ -78,10 +134,11 @@ class AuthManager:
         """
         try:
             users = self.get_users()
-            password_hash = self.hash_password(password)
             
-            # Check if username exists and password matches
-            if username in users and users[username] == password_hash:
+            # Always run a full hash comparison so unknown usernames and wrong
+            # passwords take the same time
+            password_ok = self.verify_password(password, users.get(username, _DUMMY_HASH))
+            if username in users and password_ok:
                 logger.info(f"Successful login for user: {username}")
                 return True
             else:
@@ -129,8 +186,8 @@ class AuthManager:
             del st.session_state.login_time
         if 'data' in st.session_state:
             del st.session_state.data
-        if 'filtered_data' in st.session_state:
-            del st.session_state.filtered_data
+        if 'stats' in st.session_state:
+            del st.session_state.stats
     
     def render_login_page(self):
         """Render the login page"""
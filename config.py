@@ -11,6 +11,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Separator for listing missing settings one per line as "  - NAME"
+MISSING_ITEM_SEP = "\n  - "
+
+# .env is read into os.environ at most once per process
+_dotenv_loaded = False
+
+
+def load_dotenv_once():
+    """Load .env on first use only; later calls are no-ops"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
 
 class JiraConfig(BaseModel):
     """Jira Configuration Model with validation"""
@@ -41,21 +56,30 @@ class JiraConfig(BaseModel):
 class AppConfig:
     """Application Configuration Manager"""
     
+    __slots__ = ('jira_config', '_has_secrets_cached')
+    
     def __init__(self):
         self.jira_config: Optional[JiraConfig] = None
+        self._has_secrets_cached: Optional[bool] = None
         
     def _has_streamlit_secrets(self) -> bool:
-        """Check if Streamlit secrets are available"""
+        """Check if Streamlit secrets are available (probed once per process)"""
+        if self._has_secrets_cached is None:
+            self._has_secrets_cached = self._probe_streamlit_secrets()
+        return self._has_secrets_cached
+    
+    @staticmethod
+    def _probe_streamlit_secrets() -> bool:
+        """Check for at least one secret without copying the whole mapping"""
         try:
             # Check if we have access to st.secrets and it has content
             if not hasattr(st, 'secrets'):
                 return False
             
-            # Try to access secrets - if it raises an error, no secrets available
+            # Truthiness is False when empty; no secrets file raises instead
             try:
-                _ = dict(st.secrets)
-                return len(st.secrets) > 0
-            except:
+                return bool(st.secrets)
+            except Exception:
                 return False
         except Exception:
             return False
@@ -129,8 +153,7 @@ class AppConfig:
     def _load_env_vars(self) -> JiraConfig:
         """Load configuration from .env file (local development only)"""
         try:
-            from dotenv import load_dotenv
-            load_dotenv()
+            load_dotenv_once()
             
             cloud_id = os.getenv("JIRA_CLOUD_ID")
             project_key = os.getenv("JIRA_PROJECT_KEY")
@@ -149,7 +172,7 @@ class AppConfig:
             if missing_vars:
                 raise ValueError(
                     f"Missing required environment variables in .env file:\n"
-                    f"  - {chr(10).join(missing_vars)}\n\n"
+                    f"  - {MISSING_ITEM_SEP.join(missing_vars)}\n\n"
                     f"📝 Copy .env.example to .env and fill in your Jira credentials.\n"
                     f"📖 See CONFIGURATION_GUIDE.md for setup instructions."
                 )
@@ -4,9 +4,11 @@ Transforms Jira API responses into structured dataframes
 """
 
 import pandas as pd
+import numpy as np
 from typing import List, Dict, Any, Optional
 import logging
-from datetime import datetime
+
+from jira_client import DEFAULT_SEARCH_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,40 @@ logger = logging.getLogger(__name__)
 class DataProcessor:
     """Process and transform Jira data"""
     
+    # Jira issue fields read by issues_to_dataframe; searches request only these
+    REQUIRED_FIELDS = DEFAULT_SEARCH_FIELDS
+    
+    # Columns validate_dataframe expects in a processed frame
+    REQUIRED_COLUMNS = frozenset({
+        'Epic/Story', 'Issue key', 'Summary',
+        'Reporter', 'Priority', 'QA Status', 'Comments'
+    })
+    
+    # Sort order for the Priority column; 'None' (no priority) always sorts last
+    PRIORITY_ORDER = ('P0', 'P1', 'P2', 'P3', 'P4', 'None')
+    
+    # Flattened json_normalize column -> DataFrame column
+    _FLAT_COLUMNS = {
+        'fields.parent.key': 'Epic/Story',
+        'key': 'Issue key',
+        'fields.summary': 'Summary',
+        'fields.reporter.displayName': 'Reporter',
+        'fields.priority.name': 'Priority',
+        'fields.status.name': 'QA Status',
+        'fields.created': 'Created Date',
+    }
+    
+    # Values used when an issue lacks the field (or it is null)
+    _COLUMN_DEFAULTS = {
+        'Epic/Story': '',
+        'Issue key': '',
+        'Summary': '',
+        'Reporter': 'Unknown',
+        'Priority': 'None',
+        'QA Status': 'Unknown',
+        'Created Date': '',
+    }
+    
     @staticmethod
     def issues_to_dataframe(issues: List[Dict[str, Any]], base_url: str = "") -> pd.DataFrame:
         """
@@ -29,74 +65,48 @@ class DataProcessor:
             logger.warning("No issues provided for processing")
             return pd.DataFrame()
         
-        processed_data = []
-        
-        for issue in issues:
-            try:
-                fields = issue.get('fields', {})
-                
-                # Extract parent information
-                parent = fields.get('parent')
-                parent_key = parent.get('key', '') if parent else ''
-                parent_summary = parent.get('fields', {}).get('summary', '') if parent else ''
-                
-                # Extract reporter information
-                reporter = fields.get('reporter', {})
-                reporter_name = reporter.get('displayName', 'Unknown') if reporter else 'Unknown'
-                
-                # Extract priority
-                priority = fields.get('priority', {})
-                priority_name = priority.get('name', 'None') if priority else 'None'
-                
-                # Extract status
-                status = fields.get('status', {})
-                status_name = status.get('name', 'Unknown') if status else 'Unknown'
-                
-                # Extract created date
-                created = fields.get('created', '')
-                created_date = ''
-                if created:
-                    try:
-                        # Parse ISO format date
-                        dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                        created_date = dt.strftime('%Y-%m-%d')
-                    except:
-                        created_date = created[:10] if len(created) >= 10 else ''
-                
-                # Build Jira URL
-                issue_key = issue.get('key', '')
-                jira_url = f"{base_url}/browse/{issue_key}" if base_url and issue_key else ''
-                
-                # Build Epic/Story URL
-                epic_url = f"{base_url}/browse/{parent_key}" if base_url and parent_key else ''
-                
-                processed_data.append({
-                    'Epic/Story': parent_key,
-                    'Epic URL': epic_url,
-                    'Issue key': issue_key,
-                    'Issue URL': jira_url,
-                    'Summary': fields.get('summary', ''),
-                    'Reporter': reporter_name,
-                    'Priority': priority_name,
-                    'QA Status': status_name,
-                    'Created Date': created_date,
-                    'Comments': ''
-                })
-                
-            except Exception as e:
-                logger.error(f"Error processing issue {issue.get('key', 'unknown')}: {str(e)}")
-                continue
-        
-        if not processed_data:
-            logger.warning("No data was successfully processed")
-            return pd.DataFrame()
-        
-        df = pd.DataFrame(processed_data)
-        
-        # Sort by priority
-        priority_order = {'P0': 0, 'P1': 1, 'P2': 2, 'P3': 3, 'P4': 4, 'None': 5}
-        df['priority_sort'] = df['Priority'].map(priority_order).fillna(5)
-        df = df.sort_values('priority_sort').drop('priority_sort', axis=1)
+        # Flatten the nested issue JSON in one pass; parent.fields stays a
+        # dict column since nothing below it is used
+        flat = pd.json_normalize(issues, sep='.', max_level=2)
+        flat = flat.reindex(columns=list(DataProcessor._FLAT_COLUMNS))
+        
+        df = flat.rename(columns=DataProcessor._FLAT_COLUMNS)
+        df = df.fillna(DataProcessor._COLUMN_DEFAULTS).astype(str)
+        
+        # Build Jira URLs for issues and their Epic/Story parents in one
+        # vectorized concat per column; without a base URL there are no links
+        for key_col, url_col in (('Issue key', 'Issue URL'), ('Epic/Story', 'Epic URL')):
+            if base_url:
+                keys = df[key_col]
+                df[url_col] = (f"{base_url}/browse/" + keys).where(keys != '', '')
+            else:
+                df[url_col] = ''
+        
+        df['Comments'] = ''
+        df = df.reindex(columns=[
+            'Epic/Story', 'Epic URL', 'Issue key', 'Issue URL', 'Summary',
+            'Reporter', 'Priority', 'QA Status', 'Created Date', 'Comments'
+        ])
+        
+        # Jira timestamps carry the site's UTC offset, so the leading
+        # YYYY-MM-DD is the local calendar date; parse it once to datetime64
+        df['Created Date'] = pd.to_datetime(
+            df['Created Date'].str[:10], format='%Y-%m-%d', errors='coerce'
+        )
+        
+        # Priority is an ordered categorical (P0..P4, then any other names
+        # this Jira uses, then 'None'), so sorting compares integer codes
+        extra = sorted(set(df['Priority']) - set(DataProcessor.PRIORITY_ORDER))
+        df['Priority'] = pd.Categorical(
+            df['Priority'],
+            categories=[*DataProcessor.PRIORITY_ORDER[:-1], *extra, 'None'],
+            ordered=True
+        )
+        df = df.sort_values('Priority', kind='stable')
+        
+        # Other low-cardinality columns are stored as categoricals
+        for col in ('QA Status', 'Reporter'):
+            df[col] = pd.Categorical(df[col])
         
         logger.info(f"Successfully processed {len(df)} issues")
         return df
@@ -110,21 +120,28 @@ class DataProcessor:
             df: Processed DataFrame
             
         Returns:
-            Dictionary with summary statistics
+            Dictionary with the issue total and per-value counts as
+            Series sorted largest first
         """
         if df.empty:
+            empty = pd.Series(dtype='int64')
             return {
                 'total_issues': 0,
-                'by_priority': {},
-                'by_status': {},
-                'by_reporter': {}
+                'by_priority': empty,
+                'by_status': empty,
+                'by_reporter': empty
             }
         
+        def counts(col: str) -> pd.Series:
+            values = df[col].value_counts()
+            # Categorical columns also report unused categories with a zero count
+            return values[values > 0]
+        
         return {
             'total_issues': len(df),
-            'by_priority': df['Priority'].value_counts().to_dict(),
-            'by_status': df['QA Status'].value_counts().to_dict(),
-            'by_reporter': df['Reporter'].value_counts().to_dict()
+            'by_priority': counts('Priority'),
+            'by_status': counts('QA Status'),
+            'by_reporter': counts('Reporter')
         }
     
     @staticmethod
@@ -142,7 +159,7 @@ class DataProcessor:
         
         Args:
             df: Source DataFrame
-            search_term: Text to search in summary
+            search_term: Text to search in summary and issue key
             priorities: List of priorities to include
             statuses: List of statuses to include
             reporters: List of reporters to include
@@ -152,32 +169,32 @@ class DataProcessor:
         Returns:
             Filtered DataFrame
         """
-        filtered_df = df.copy()
+        # Combine every condition into one row mask and index the frame once
+        mask = np.ones(len(df), dtype=bool)
         
         if search_term:
-            mask = (
-                filtered_df['Summary'].str.contains(search_term, case=False, na=False) |
-                filtered_df['Issue key'].str.contains(search_term, case=False, na=False)
-            )
-            filtered_df = filtered_df[mask]
+            mask &= (
+                df['Summary'].str.contains(search_term, case=False, na=False, regex=False) |
+                df['Issue key'].str.contains(search_term, case=False, na=False, regex=False)
+            ).to_numpy(dtype=bool)
         
         if priorities:
-            filtered_df = filtered_df[filtered_df['Priority'].isin(priorities)]
+            mask &= df['Priority'].isin(priorities).to_numpy()
         
         if statuses:
-            filtered_df = filtered_df[filtered_df['QA Status'].isin(statuses)]
+            mask &= df['QA Status'].isin(statuses).to_numpy()
         
         if reporters:
-            filtered_df = filtered_df[filtered_df['Reporter'].isin(reporters)]
-        
-        # Date filtering
-        if start_date and 'Created Date' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Created Date'] >= start_date]
+            mask &= df['Reporter'].isin(reporters).to_numpy()
         
-        if end_date and 'Created Date' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Created Date'] <= end_date]
+        # Date filtering (inclusive on both ends)
+        if (start_date or end_date) and 'Created Date' in df.columns:
+            mask &= df['Created Date'].between(
+                pd.Timestamp(start_date) if start_date else pd.Timestamp.min,
+                pd.Timestamp(end_date) if end_date else pd.Timestamp.max
+            ).to_numpy()
         
-        return filtered_df
+        return df[mask]
     
     @staticmethod
     def validate_dataframe(df: pd.DataFrame) -> bool:
@@ -190,18 +207,13 @@ class DataProcessor:
         Returns:
             True if valid, False otherwise
         """
-        required_columns = [
-            'Epic/Story', 'Issue key', 'Summary',
-            'Reporter', 'Priority', 'QA Status', 'Comments'
-        ]
-        
         if df.empty:
             logger.warning("DataFrame is empty")
             return False
         
-        missing_columns = set(required_columns) - set(df.columns)
+        missing_columns = DataProcessor.REQUIRED_COLUMNS.difference(df.columns)
         if missing_columns:
-            logger.error(f"Missing required columns: {missing_columns}")
+            logger.error(f"Missing required columns: {sorted(missing_columns)}")
             return False
         
         return True
\ No newline at end of file
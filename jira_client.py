@@ -4,14 +4,101 @@ Handles secure communication with Atlassian Jira API
 """
 
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Sequence, Callable, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 import base64
+import functools
+import threading
+from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson  # optional: faster parsing of large search responses
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    import ijson  # optional: stream reporter names out of search responses
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Issue fields requested from the search API by default - only what
+# DataProcessor.issues_to_dataframe reads, to keep responses small. This is
+# the single list; DataProcessor.REQUIRED_FIELDS refers to it
+DEFAULT_SEARCH_FIELDS = ('summary', 'status', 'priority', 'reporter', 'parent', 'created')
+
+# Largest page of full issues the search and bulk fetch endpoints return
+SEARCH_PAGE_SIZE = 100
+
+# Keep-alive connections held open per host by the client's session;
+# sized above the default worker count so page requests never wait for one
+CONNECTION_POOL_SIZE = 16
+
+# Responses retried by the session adapter (throttling and transient server
+# errors); once retries run out the last response reaches _handle_response
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# Concurrent page requests used for searches larger than one page
+DEFAULT_MAX_WORKERS = 8
+
+# Streamed reporter attributes kept by JiraClient._read_reporter_page
+_REPORTER_PREFIXES = {
+    f'issues.item.fields.reporter.{key}': key
+    for key in ('accountId', 'displayName', 'name')
+}
+
+# Default concurrency for JiraClient.batch
+BATCH_MAX_WORKERS = 4
+
+# Token bucket for outgoing requests: up to RATE_LIMIT_BURST back-to-back
+# requests after idle time, then RATE_LIMIT_PER_SECOND sustained
+RATE_LIMIT_BURST = 5
+RATE_LIMIT_PER_SECOND = 2.0
+
+# How long project metadata lookups are reused before refetching (seconds)
+ISSUE_TYPES_TTL = 3600
+PROJECT_USERS_TTL = 900
+
+# Reporter discovery reads recent issues a page at a time, stopping after
+# this many pages add no new name or this many issues in total
+USERS_STABLE_PAGES = 2
+USERS_SCAN_LIMIT = 500
+
+
+# Status filter values that stand for several Jira status names
+_STATUS_ALIASES = {
+    'To Do': ('01_To Do', 'To Do'),
+}
+
+# Filter used by the "Need Clarification" preset in place of type/status
+_CLARIFICATION_CLAUSES = (
+    'status IN ("01_To Do", "To Do", "Ready For Dev")',
+    'type = Task',
+    'summary ~ "clarification"',
+)
+
+
+def _in_clause(field: str, values: Sequence[str]) -> str:
+    """JQL clause matching field against one value or any of several"""
+    if len(values) == 1:
+        return f'{field} = "{values[0]}"'
+    quoted = ', '.join(f'"{value}"' for value in values)
+    return f'{field} IN ({quoted})'
+
+
+@functools.lru_cache(maxsize=8)
+def _basic_auth_header(email: str, api_token: str) -> str:
+    """Basic Authorization header value, encoded once per credential pair"""
+    return "Basic " + base64.b64encode(f"{email}:{api_token}".encode()).decode()
+
 
 class JiraAPIError(Exception):
     """Custom exception for Jira API errors"""
@@ -21,21 +108,58 @@ class JiraAPIError(Exception):
 class JiraClient:
     """Secure Jira API Client with rate limiting and error handling"""
     
-    def __init__(self, cloud_id: str, project_key: str, base_url: str, email: Optional[str] = None, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        cloud_id: str,
+        project_key: str,
+        base_url: str,
+        email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        page_size: int = SEARCH_PAGE_SIZE
+    ):
         self.cloud_id = cloud_id
         self.project_key = project_key
         # Use the direct Jira instance URL, not the api.atlassian.com endpoint
         self.base_url = base_url.rstrip('/')
+        # requests advertises Brotli (Accept-Encoding: br) on its own whenever
+        # the optional brotli package is installed, alongside gzip/deflate
         self.session = requests.Session()
-        self.rate_limit_delay = 0.5  # seconds between requests
-        self.last_request_time = 0
+        # Pooled keep-alive connections; the adapter retries connection errors
+        # and throttling/server errors, honouring Jira's Retry-After header
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['GET', 'POST']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._rate_capacity = RATE_LIMIT_BURST
+        self._refill_rate = RATE_LIMIT_PER_SECOND
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        # Metadata lookup results by name: (fetched at, value), with their own
+        # lock so cache hits never wait behind a rate-limited request
+        self._cache_lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Loads in progress by key, so concurrent misses share one request
+        self._inflight: Dict[str, Future] = {}
+        self.max_workers = max(1, max_workers)  # concurrent page requests for large searches
+        # Jira Cloud caps search and bulk fetch pages at SEARCH_PAGE_SIZE issues
+        self.page_size = max(1, min(page_size, SEARCH_PAGE_SIZE))
         
         # Setup authentication if credentials provided
         if email and api_token:
-            auth_string = f"{email}:{api_token}"
-            b64_auth = base64.b64encode(auth_string.encode()).decode()
             self.session.headers.update({
-                'Authorization': f'Basic {b64_auth}',
+                'Authorization': _basic_auth_header(email, api_token),
                 'Accept': 'application/json',
                 'Content-Type': 'application/json'
             })
@@ -45,18 +169,97 @@ class JiraClient:
         
         logger.info(f"Initialized Jira client for project: {project_key} at {self.base_url}")
     
+    def rotate_credentials(self, email: str, api_token: str):
+        """Switch the session to a new email/API token pair"""
+        # Drop cached headers so replaced tokens do not linger in memory
+        _basic_auth_header.cache_clear()
+        self.session.headers.update({
+            'Authorization': _basic_auth_header(email, api_token),
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        })
+        logger.info("Rotated Jira client credentials")
+    
     def _rate_limit(self):
-        """Implement rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        """
+        Take a token from the rate limit bucket, waiting if it is empty
+        
+        Idle time refills the bucket, so short bursts go out without any
+        delay and only sustained load is paced. Safe to call from worker
+        threads: the token is reserved under the lock (the balance may go
+        negative) and the wait happens after releasing it.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._rate_capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            
+            wait = max(0.0, (1 - self._tokens) / self._refill_rate)
+            self._tokens -= 1
+        
+        if wait:
+            time.sleep(wait)
+    
+    def _cached(self, key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader when missing or stale
+        
+        The lock only guards the dictionaries; loader runs outside it because
+        it makes rate-limited requests. Concurrent misses for the same key
+        wait on the first caller's load instead of starting their own.
+        Exceptions from loader propagate to every waiter and nothing is cached.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+    
+    def _is_cached(self, key: str, ttl: float) -> bool:
+        """Whether key holds a value younger than ttl, without loading it"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            return entry is not None and time.monotonic() - entry[0] < ttl
+    
+    def invalidate_cache(self, prefix: Optional[str] = None):
+        """Drop cached metadata lookups, or only those whose key starts with prefix"""
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k.startswith(prefix)]:
+                    del self._cache[key]
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response with proper error handling"""
         try:
             response.raise_for_status()
-            return response.json()
+            # Parse the raw bytes directly; both parsers raise ValueError subclasses
+            return _json_loads(response.content)
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error occurred: {e}")
             if response.status_code == 401:
@@ -76,13 +279,17 @@ class JiraClient:
     
     def search_issues(
         self,
-        issue_types: List[str],
-        statuses: List[str],
-        priorities: List[str],
+        issue_types: Sequence[str],
+        statuses: Sequence[str],
+        priorities: Sequence[str],
         include_sprint_filter: bool = False,
         filter_clarifications: bool = False,
         summary_search: Optional[str] = None,
-        max_results: int = 100
+        reporters: Optional[Sequence[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_results: int = 100,
+        fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search Jira issues with filters
@@ -94,7 +301,12 @@ class JiraClient:
             include_sprint_filter: If True, filter for issues without sprint
             filter_clarifications: If True, filter for tasks with clarification in summary
             summary_search: Optional text to search in issue summaries
+            reporters: Optional list of reporters to include, as account IDs
+                from resolve_reporters (or names Jira can resolve)
+            start_date: Only issues created on or after this date (YYYY-MM-DD)
+            end_date: Only issues created on or before this date (YYYY-MM-DD)
             max_results: Maximum number of results to return
+            fields: Issue fields to return (defaults to DEFAULT_SEARCH_FIELDS)
         
         Returns:
             List of issues
@@ -103,56 +315,40 @@ class JiraClient:
             # Build JQL query
             jql_parts = [f'project = {self.project_key}']
             
-            # Add issue type filter
-            if issue_types:
-                if len(issue_types) == 1:
-                    jql_parts.append(f'type = "{issue_types[0]}"')
-                else:
-                    types_str = ', '.join([f'"{t}"' for t in issue_types])
-                    jql_parts.append(f'type IN ({types_str})')
-            
-            # Add status filter
-            if statuses:
-                # Expand "To Do" to include both "01_To Do" and "To Do"
-                expanded_statuses = []
-                for status in statuses:
-                    if status == "To Do":
-                        # Add both variants for To Do
-                        expanded_statuses.extend(["01_To Do", "To Do"])
-                    else:
-                        expanded_statuses.append(status)
-                
-                if len(expanded_statuses) == 1:
-                    jql_parts.append(f'status = "{expanded_statuses[0]}"')
-                else:
-                    statuses_str = ', '.join([f'"{s}"' for s in expanded_statuses])
-                    jql_parts.append(f'status IN ({statuses_str})')
+            # The clarification preset replaces the type and status filters
+            if not filter_clarifications:
+                if issue_types:
+                    jql_parts.append(_in_clause('type', issue_types))
+                if statuses:
+                    # Expand aliases such as "To Do" to every status name they cover
+                    jql_parts.append(_in_clause('status', list(chain.from_iterable(
+                        _STATUS_ALIASES.get(status, (status,)) for status in statuses
+                    ))))
             
-            # Add priority filter
             if priorities:
-                if len(priorities) == 1:
-                    jql_parts.append(f'priority = "{priorities[0]}"')
-                else:
-                    priorities_str = ', '.join([f'"{p}"' for p in priorities])
-                    jql_parts.append(f'priority IN ({priorities_str})')
+                jql_parts.append(_in_clause('priority', priorities))
             
             # Add sprint filter
             if include_sprint_filter:
                 jql_parts.append('sprint is EMPTY')
             
+            if reporters:
+                jql_parts.append(_in_clause('reporter', reporters))
+            
+            # Add created date range filter (end date is inclusive)
+            if start_date:
+                jql_parts.append(f'created >= "{start_date}"')
+            if end_date:
+                day_after_end = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
+                jql_parts.append(f'created < "{day_after_end.strftime("%Y-%m-%d")}"')
+            
             # Add custom summary search filter
             if summary_search:
                 # Use JQL text search operator (~) for case-insensitive search
                 jql_parts.append(f'summary ~ "{summary_search}"')
             
-            # Add clarification filter - overrides statuses and types with specific logic
             if filter_clarifications:
-                # Remove previous status and type filters
-                jql_parts = [part for part in jql_parts if not (part.startswith('status') or part.startswith('type'))]
-                # Add specific clarification filter logic
-                jql_parts.append('status IN ("01_To Do", "To Do", "Ready For Dev")')
-                jql_parts.append('type = Task')
-                jql_parts.append('summary ~ "clarification"')
+                jql_parts.extend(_CLARIFICATION_CLAUSES)
             
             jql = ' AND '.join(jql_parts) + ' ORDER BY ' + ('rank' if filter_clarifications else 'priority ASC, created DESC')
             
@@ -162,16 +358,55 @@ class JiraClient:
             # the actual API calls would go through the Atlassian tools
             # This is a reference implementation
             
-            return self._execute_jql_search(jql, max_results)
+            return self._execute_jql_search(jql, max_results, fields)
             
         except Exception as e:
             logger.error(f"Issue search failed: {str(e)}")
             raise JiraAPIError(f"Failed to search issues: {str(e)}")
     
-    def _execute_jql_search(self, jql: str, max_results: int) -> List[Dict[str, Any]]:
+    def _execute_jql_search(
+        self,
+        jql: str,
+        max_results: int,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Execute JQL search using the /rest/api/3/search/jql endpoint
+        
+        Results that fit in one page are fetched with a single request.
+        The search endpoint only pages by cursor, so larger searches first
+        collect the matching issue IDs with a light ID-only query and then
+        fetch the issue pages concurrently through the bulk fetch endpoint.
         """
+        fields = list(fields or DEFAULT_SEARCH_FIELDS)
+        
+        try:
+            if max_results <= self.page_size:
+                issues = self._search_page(jql, max_results, fields)
+            else:
+                issue_ids = self._search_issue_ids(jql, max_results)
+                pages = [
+                    issue_ids[i:i + self.page_size]
+                    for i in range(0, len(issue_ids), self.page_size)
+                ]
+                
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = executor.map(lambda ids: self._bulk_fetch_issues(ids, fields), pages)
+                    issues = [issue for page in results for issue in page]
+                
+                # Bulk fetch does not guarantee order, so restore the JQL ordering
+                position = {issue_id: i for i, issue_id in enumerate(issue_ids)}
+                issues.sort(key=lambda issue: position.get(issue.get('id'), len(position)))
+            
+            logger.info(f"Retrieved {len(issues)} issues from Jira")
+            return issues
+            
+        except Exception as e:
+            logger.error(f"JQL search failed: {str(e)}")
+            raise
+    
+    def _search_page(self, jql: str, max_results: int, fields: List[str]) -> List[Dict[str, Any]]:
+        """Fetch a single page of issues with the requested fields"""
         self._rate_limit()
         
         # Use the /rest/api/3/search/jql endpoint with minimal payload
@@ -180,39 +415,78 @@ class JiraClient:
         payload = {
             'jql': jql,
             'maxResults': max_results,
-            'fields': ['summary', 'status', 'priority', 'reporter', 'parent', 'created']
+            'fields': fields
         }
         
-        try:
+        response = self.session.post(url, json=payload, timeout=30)
+        data = self._handle_response(response)
+        return data.get('issues', [])
+    
+    def _search_issue_ids(self, jql: str, max_results: int) -> List[str]:
+        """Collect the IDs of up to max_results matching issues, in JQL order"""
+        url = f"{self.base_url}/rest/api/3/search/jql"
+        issue_ids: List[str] = []
+        next_page_token = None
+        
+        while len(issue_ids) < max_results:
+            self._rate_limit()
+            
+            payload = {
+                'jql': jql,
+                'maxResults': max_results - len(issue_ids),
+                'fields': ['id']
+            }
+            if next_page_token:
+                payload['nextPageToken'] = next_page_token
+            
             response = self.session.post(url, json=payload, timeout=30)
             data = self._handle_response(response)
             
             issues = data.get('issues', [])
-            logger.info(f"Retrieved {len(issues)} issues from Jira")
-            return issues
+            issue_ids.extend(issue['id'] for issue in issues)
             
-        except Exception as e:
-            logger.error(f"JQL search failed: {str(e)}")
-            raise
+            next_page_token = data.get('nextPageToken')
+            if not next_page_token or not issues:
+                break
+        
+        return issue_ids[:max_results]
+    
+    def _bulk_fetch_issues(self, issue_ids: List[str], fields: List[str]) -> List[Dict[str, Any]]:
+        """Fetch one page of issues by ID using the bulk fetch endpoint"""
+        self._rate_limit()
+        
+        url = f"{self.base_url}/rest/api/3/issue/bulkfetch"
+        
+        payload = {
+            'issueIdsOrKeys': issue_ids,
+            'fields': fields
+        }
+        
+        response = self.session.post(url, json=payload, timeout=30)
+        data = self._handle_response(response)
+        return data.get('issues', [])
     
     def get_issue_types(self) -> List[str]:
-        """Get available issue types for the project"""
+        """Get available issue types for the project (cached for ISSUE_TYPES_TTL)"""
         try:
-            self._rate_limit()
-            
-            url = f"{self.base_url}/rest/api/3/project/{self.project_key}"
-            response = self.session.get(url, timeout=30)
-            data = self._handle_response(response)
-            
-            issue_types = [it['name'] for it in data.get('issueTypes', [])]
-            logger.info(f"Retrieved {len(issue_types)} issue types")
-            return issue_types
-            
+            return list(self._cached('issue_types', ISSUE_TYPES_TTL, self._fetch_issue_types))
         except Exception as e:
             logger.warning(f"Failed to get issue types from API: {str(e)}")
             # Return default fallback
             return ['Bug', 'Task', 'Story', 'Epic']
     
+    def _fetch_issue_types(self) -> List[str]:
+        """Request the project's issue types from Jira"""
+        self._rate_limit()
+        
+        url = f"{self.base_url}/rest/api/3/project/{self.project_key}"
+        response = self.session.get(url, timeout=30)
+        data = self._handle_response(response)
+        
+        issue_types = [it['name'] for it in data.get('issueTypes', [])]
+        logger.info(f"Retrieved {len(issue_types)} issue types")
+        return issue_types
+    
     def get_statuses(self) -> List[str]:
         """Get available statuses"""
         # Common Jira statuses - can be enhanced to fetch from API
@@ -235,50 +509,201 @@ class JiraClient:
         # Common priorities - can be enhanced to fetch from API
         return ['P0', 'P1', 'P2', 'P3', 'P4', 'None']
     
-    def get_project_users(self) -> List[str]:
-        """Get all users with access to the project by fetching reporters from recent issues"""
+    def get_project_users(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get all users with access to the project by fetching reporters from recent issues
+        
+        Args:
+            limit: Return only the first limit names in sorted order
+        """
+        try:
+            # The cached mapping is sorted by name once per fetch, so a limit is just a slice
+            users = self._cached('project_users', PROJECT_USERS_TTL, self._fetch_project_users)
+            return list(users)[:limit] if users else self._get_default_qa_team()[:limit]
+            
+        except Exception as e:
+            logger.warning(f"Failed to get project users from API: {str(e)}")
+            return self._get_default_qa_team()[:limit]
+    
+    def resolve_reporters(self, names: Sequence[str]) -> Optional[List[str]]:
+        """
+        Map reporter display names to the account IDs JQL can match on
+        
+        A display name shared by several accounts maps to all of them.
+        Returns None if any name is not a known project reporter (or the
+        lookup fails), since Jira rejects the whole query for an unknown user.
+        """
         try:
+            users = self._cached('project_users', PROJECT_USERS_TTL, self._fetch_project_users)
+        except Exception as e:
+            logger.warning(f"Failed to resolve reporters: {str(e)}")
+            return None
+        
+        account_ids: List[str] = []
+        for name in names:
+            if name not in users:
+                return None
+            account_ids.extend(users[name])
+        return account_ids
+    
+    def _fetch_project_users(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Collect the reporters of recent issues as display name -> account IDs
+        
+        Pages through the newest issues requesting only the reporter field,
+        and stops once USERS_STABLE_PAGES pages in a row add no new reporter
+        or USERS_SCAN_LIMIT issues have been read. Reporters are told apart
+        by accountId (username on servers without one), keeping the first
+        display name seen for each. The mapping is sorted by display name.
+        """
+        # Instead of using user/search which has parameter issues,
+        # we'll fetch recent issues and extract unique reporters
+        # This gives us actual active users on the project
+        url = f"{self.base_url}/rest/api/3/search/jql"
+        names_by_account: Dict[str, str] = {}
+        scanned = 0
+        stable_pages = 0
+        next_page_token = None
+        
+        while scanned < USERS_SCAN_LIMIT:
             self._rate_limit()
             
-            # Instead of using user/search which has parameter issues,
-            # we'll fetch recent issues and extract unique reporters
-            # This gives us actual active users on the project
-            url = f"{self.base_url}/rest/api/3/search/jql"
-            
             payload = {
                 'jql': f'project = {self.project_key} ORDER BY created DESC',
-                'maxResults': 1000,  # Fetch many issues to get diverse reporters
+                'maxResults': min(SEARCH_PAGE_SIZE, USERS_SCAN_LIMIT - scanned),
                 'fields': ['reporter']
             }
+            if next_page_token:
+                payload['nextPageToken'] = next_page_token
             
-            response = self.session.post(url, json=payload, timeout=30)
-            data = self._handle_response(response)
+            with self.session.post(url, json=payload, timeout=30, stream=ijson is not None) as response:
+                reporters, issue_count, next_page_token = self._read_reporter_page(response)
+            scanned += issue_count
             
-            issues = data.get('issues', [])
-            
-            # Extract unique reporter names
-            user_names = set()
-            for issue in issues:
-                fields = issue.get('fields', {})
-                reporter = fields.get('reporter')
-                if reporter:
-                    display_name = reporter.get('displayName') or reporter.get('name', 'Unknown')
-                    if display_name and display_name != 'Unknown':
-                        user_names.add(display_name)
-            
-            # Convert to sorted list
-            user_list = sorted(user_names)
+            # Extract unique reporters
+            known = len(names_by_account)
+            for reporter in reporters:
+                display_name = reporter.get('displayName') or reporter.get('name', 'Unknown')
+                if display_name and display_name != 'Unknown':
+                    account_id = reporter.get('accountId') or reporter.get('name') or display_name
+                    names_by_account.setdefault(account_id, display_name)
             
-            # Log the retrieved users for debugging
-            logger.info(f"Retrieved {len(user_list)} unique reporters for project {self.project_key}")
-            if user_list:
-                logger.debug(f"Reporter list: {', '.join(user_list)}")
+            stable_pages = stable_pages + 1 if len(names_by_account) == known else 0
             
-            return user_list if user_list else self._get_default_qa_team()
-            
-        except Exception as e:
-            logger.warning(f"Failed to get project users from API: {str(e)}")
-            return self._get_default_qa_team()
+            if not next_page_token or not issue_count or stable_pages >= USERS_STABLE_PAGES:
+                break
+        
+        # Group by display name; people sharing one are listed once and the
+        # reporter filter matches all of their accounts
+        accounts_by_name: Dict[str, List[str]] = {}
+        for account_id, display_name in names_by_account.items():
+            accounts_by_name.setdefault(display_name, []).append(account_id)
+        users = {name: tuple(accounts_by_name[name]) for name in sorted(accounts_by_name)}
+        
+        # Log the retrieved users for debugging
+        logger.info(
+            f"Retrieved {len(users)} unique reporters from {scanned} issues "
+            f"for project {self.project_key}"
+        )
+        if users and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Reporter list: %s", ', '.join(users))
+        
+        return users
+    
+    def _read_reporter_page(self, response: requests.Response) -> Tuple[List[Dict[str, str]], int, Optional[str]]:
+        """
+        Read one reporter search page
+        
+        Returns the reporter of each issue that has one (at least its
+        accountId, displayName and name), the number of issues on the page
+        and the next page token. With ijson installed the body is streamed
+        and only those values are built; otherwise it is parsed as a whole
+        by _handle_response.
+        """
+        if ijson is None or not response.ok:
+            data = self._handle_response(response)
+            issues = data.get('issues', [])
+            reporters = [
+                reporter
+                for reporter in (issue.get('fields', {}).get('reporter') for issue in issues)
+                if reporter
+            ]
+            return reporters, len(issues), data.get('nextPageToken')
+        
+        reporters: List[Dict[str, str]] = []
+        issue_count = 0
+        next_page_token = None
+        reporter: Dict[str, str] = {}
+        
+        try:
+            response.raw.decode_content = True
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'issues.item' and event == 'start_map':
+                    issue_count += 1
+                elif prefix == 'issues.item.fields.reporter':
+                    if event == 'start_map':
+                        reporter = {}
+                    elif event == 'end_map':
+                        reporters.append(reporter)
+                elif prefix in _REPORTER_PREFIXES:
+                    reporter[_REPORTER_PREFIXES[prefix]] = value
+                elif prefix == 'nextPageToken':
+                    next_page_token = value
+        except (ijson.JSONError, requests.exceptions.RequestException) as e:
+            logger.error(f"Failed to read streamed response: {e}")
+            raise JiraAPIError("Invalid response from Jira API")
+        
+        return reporters, issue_count, next_page_token
+    
+    def get_reference_data_concurrent(self) -> Dict[str, List[str]]:
+        """
+        Fetch the sidebar reference data in one call
+        
+        The issue type and project user lookups are independent network
+        requests, so those not already cached run as one batch; statuses
+        and priorities are static lists.
+        
+        Returns:
+            Dictionary with 'issue_types', 'statuses', 'priorities' and 'users'
+        """
+        lookups = (
+            (self.get_issue_types, 'issue_types', ISSUE_TYPES_TTL),
+            (self.get_project_users, 'project_users', PROJECT_USERS_TTL),
+        )
+        # Cache hits are answered inline; only misses go to batch(), which
+        # skips the thread pool when there is just one of them
+        misses = [get for get, key, ttl in lookups if not self._is_cached(key, ttl)]
+        fetched = dict(zip(misses, self.batch(misses)))
+        issue_types, users = (fetched[get] if get in fetched else get() for get, _, _ in lookups)
+        
+        return {
+            'issue_types': issue_types,
+            'statuses': self.get_statuses(),
+            'priorities': self.get_priorities(),
+            'users': users
+        }
+    
+    def batch(self, calls: Sequence[Callable[[], Any]], max_workers: int = BATCH_MAX_WORKERS) -> List[Any]:
+        """
+        Run independent client calls concurrently on the shared session
+        
+        Requests still go through the token bucket, so a batch cannot exceed
+        the client's rate limit; it only overlaps the network waits.
+        
+        Args:
+            calls: Zero-argument callables, e.g. bound methods or lambdas
+            max_workers: Upper bound on calls in flight at once
+        
+        Returns:
+            Results in the same order as calls; the first exception raised
+            by a call is re-raised
+        """
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
     
     def _get_default_qa_team(self) -> List[str]:
         """Return default QA team as fallback"""
@@ -0,0 +1,50 @@
+"""
+Login timing: every credential check must do the same PBKDF2 work, whether
+the user is unknown, has a legacy SHA-256 hash or a PBKDF2 record
+"""
+
+import hashlib
+from unittest import mock
+
+import pytest
+
+import auth
+from add_user import PBKDF2_ITERATIONS, hash_password
+
+
+@pytest.fixture
+def manager():
+    manager = auth.AuthManager()
+    manager._users_cache = {
+        'admin': auth._DEFAULT_ADMIN_HASH,
+        'legacy': hashlib.sha256(b'secret').hexdigest(),
+        'modern': hash_password('secret'),
+        'broken': 'not-a-hash',
+    }
+    return manager
+
+
+def _pbkdf2_calls(manager, username, password):
+    with mock.patch.object(auth.hashlib, 'pbkdf2_hmac', wraps=hashlib.pbkdf2_hmac) as pbkdf2:
+        result = manager.verify_credentials(username, password)
+    return result, [call.args[3] for call in pbkdf2.call_args_list]
+
+
+@pytest.mark.parametrize('username, password, expected', [
+    ('nobody', 'secret', False),
+    ('admin', 'admin', True),
+    ('admin', 'wrong', False),
+    ('legacy', 'secret', True),
+    ('legacy', 'wrong', False),
+    ('modern', 'secret', True),
+    ('modern', 'wrong', False),
+    ('broken', 'secret', False),
+])
+def test_every_login_runs_one_full_pbkdf2_derivation(manager, username, password, expected):
+    result, iterations = _pbkdf2_calls(manager, username, password)
+    assert result is expected
+    assert iterations == [PBKDF2_ITERATIONS]
+
+
+def test_unknown_and_legacy_users_take_the_same_path(manager):
+    assert _pbkdf2_calls(manager, 'nobody', 'admin')[1] == _pbkdf2_calls(manager, 'admin', 'wrong')[1]
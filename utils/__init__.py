@@ -2,7 +2,6 @@
 
 from .logger import setup_logging, get_logger
 from .validators import InputValidator, ValidationError
-from .exporters import DataExporter, ExportError
 
 __all__ = [
     'setup_logging',
@@ -11,4 +10,12 @@ __all__ = [
     'ValidationError',
     'DataExporter',
     'ExportError'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # The export module is only loaded when something actually exports
+    if name in ('DataExporter', 'ExportError'):
+        from . import exporters
+        return getattr(exporters, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,25 @@ Handles secure export to Excel and CSV formats
 """
 
 import pandas as pd
+import numpy as np
+import re
 from io import BytesIO
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 
+try:
+    import xlsxwriter  # preferred: streams rows straight into the file
+except ImportError:
+    xlsxwriter = None
+
 logger = logging.getLogger(__name__)
 
+# Characters dropped from sheet names and filenames; \w keeps the same
+# letters and digits as str.isalnum() plus the underscore
+_SHEET_NAME_RE = re.compile(r'[^\w\- ]')
+_FILENAME_RE = re.compile(r'[^\w\-]')
+
 
 class ExportError(Exception):
     """Custom export error"""
@@ -51,80 +63,37 @@ class DataExporter:
                 sheet_name = f"{sheet_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
             # Ensure sheet name is valid (max 31 characters, no special chars)
-            sheet_name = sheet_name[:31]
-            sheet_name = ''.join(c for c in sheet_name if c.isalnum() or c in ['-', '_', ' '])
+            sheet_name = _SHEET_NAME_RE.sub('', sheet_name[:31])
             
             output = BytesIO()
             
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                # Prepare DataFrame for export
-                export_df = df.copy()
-                
-                # Keep URL columns for hyperlink creation but don't display them
-                has_issue_url = 'Issue URL' in export_df.columns
-                has_epic_url = 'Epic URL' in export_df.columns
-                
-                # Create display DataFrame (without URL columns)
-                url_columns = []
-                if has_issue_url:
-                    url_columns.append('Issue URL')
-                if has_epic_url:
-                    url_columns.append('Epic URL')
-                
-                if url_columns:
-                    display_columns = [col for col in export_df.columns if col not in url_columns]
-                    display_df = export_df[display_columns]
-                else:
-                    display_df = export_df
-                
-                # Write to Excel
-                display_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                
-                # Get worksheet
-                worksheet = writer.sheets[sheet_name]
-                
-                # Add hyperlinks to Epic/Story column if URLs are available
-                if has_epic_url and 'Epic/Story' in export_df.columns:
-                    # Find column index in display_df (not export_df)
-                    epic_col_idx = list(display_df.columns).index('Epic/Story') + 1  # Excel is 1-indexed
-                    
-                    for row_idx, (epic_key, epic_url) in enumerate(zip(export_df['Epic/Story'], export_df['Epic URL']), start=2):
-                        if epic_url and epic_key:  # Only add hyperlink if both exist
-                            cell = worksheet.cell(row=row_idx, column=epic_col_idx)
-                            cell.value = epic_key
-                            cell.hyperlink = epic_url
-                            cell.style = 'Hyperlink'
-                
-                # Add hyperlinks to Issue key column if URLs are available
-                if has_issue_url and 'Issue key' in export_df.columns:
-                    # Find column index in display_df (not export_df)
-                    issue_key_col_idx = list(display_df.columns).index('Issue key') + 1  # Excel is 1-indexed
-                    
-                    for row_idx, (issue_key, issue_url) in enumerate(zip(export_df['Issue key'], export_df['Issue URL']), start=2):
-                        if issue_url:
-                            cell = worksheet.cell(row=row_idx, column=issue_key_col_idx)
-                            cell.value = issue_key
-                            cell.hyperlink = issue_url
-                            cell.style = 'Hyperlink'
-                
-                # Auto-adjust column widths
-                for idx, col in enumerate(display_df.columns, 1):
-                    max_length = max(
-                        display_df[col].astype(str).apply(len).max(),
-                        len(col)
-                    )
-                    # Set column width (min 10, max 50)
-                    worksheet.column_dimensions[
-                        worksheet.cell(1, idx).column_letter
-                    ].width = min(max(max_length + 2, 10), 50)
-                
-                # Format header row
-                for cell in worksheet[1]:
-                    cell.font = cell.font.copy(bold=True)
-                    cell.fill = cell.fill.copy(fgColor="0052CC", patternType="solid")
-                    from openpyxl.styles import Font, PatternFill
-                    cell.font = Font(bold=True, color="FFFFFF")
-                    cell.fill = PatternFill(start_color="0052CC", end_color="0052CC", fill_type="solid")
+            # Keep URL columns for hyperlink creation but don't display them
+            url_columns = [col for col in ('Issue URL', 'Epic URL') if col in df.columns]
+            display_columns = [col for col in df.columns if col not in url_columns]
+            display_df = df[display_columns]
+            
+            # Hyperlinked key columns and the URL column each one links to
+            link_columns = {}
+            if 'Epic URL' in url_columns and 'Epic/Story' in display_columns:
+                link_columns[display_columns.index('Epic/Story')] = df['Epic URL'].tolist()
+            if 'Issue URL' in url_columns and 'Issue key' in display_columns:
+                link_columns[display_columns.index('Issue key')] = df['Issue URL'].tolist()
+            
+            # Auto-adjust column widths (min 10, max 50): longest cell text per
+            # column, or the header if longer, in one clipped array operation
+            max_lengths = (
+                display_df.astype(str)
+                .apply(lambda col: col.str.len().max())
+                .fillna(0)
+                .to_numpy()
+            )
+            header_lengths = np.fromiter(map(len, display_columns), dtype=int, count=len(display_columns))
+            widths = np.clip(np.maximum(max_lengths, header_lengths) + 2, 10, 50).tolist()
+            
+            if xlsxwriter is not None:
+                DataExporter._write_xlsxwriter(output, sheet_name, display_df, link_columns, widths)
+            else:
+                DataExporter._write_openpyxl(output, sheet_name, display_df, link_columns, widths)
             
             output.seek(0)
             logger.info(f"Successfully exported {len(df)} rows to Excel with hyperlinks")
@@ -134,6 +103,106 @@ class DataExporter:
             logger.error(f"Excel export failed: {str(e)}")
             raise ExportError(f"Failed to export to Excel: {str(e)}")
     
+    @staticmethod
+    def _is_blank(value) -> bool:
+        """True for the missing-value markers that leave a cell empty"""
+        return value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+    
+    @staticmethod
+    def _write_xlsxwriter(
+        output: BytesIO,
+        sheet_name: str,
+        display_df: pd.DataFrame,
+        link_columns: Dict[int, List[str]],
+        widths: List[float]
+    ):
+        """Write the sheet with xlsxwriter, streaming rows in constant memory"""
+        # constant_memory flushes each row once the next one starts, so the
+        # sheet has to be written strictly top to bottom, links included
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'nan_inf_to_errors': True,
+            'default_date_format': 'yyyy-mm-dd'
+        })
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({
+            'bold': True,
+            'font_color': '#FFFFFF',
+            'bg_color': '#0052CC'
+        })
+        
+        for idx, width in enumerate(widths):
+            worksheet.set_column(idx, idx, width)
+        
+        # Header row
+        worksheet.write_row(0, 0, list(display_df.columns), header_format)
+        
+        # Data rows, with the key columns written as hyperlinks; the
+        # worksheet methods are bound once outside the per-cell loop
+        write = worksheet.write
+        write_url = worksheet.write_url
+        is_blank = DataExporter._is_blank
+        for row_idx, values in enumerate(display_df.itertuples(index=False, name=None), start=1):
+            for col_idx, value in enumerate(values):
+                if is_blank(value):
+                    continue
+                url = link_columns[col_idx][row_idx - 1] if col_idx in link_columns else None
+                if url and value:
+                    write_url(row_idx, col_idx, url, string=str(value))
+                else:
+                    write(row_idx, col_idx, value)
+        
+        workbook.close()
+    
+    @staticmethod
+    def _write_openpyxl(
+        output: BytesIO,
+        sheet_name: str,
+        display_df: pd.DataFrame,
+        link_columns: Dict[int, List[str]],
+        widths: List[float]
+    ):
+        """Write the sheet with openpyxl, used when xlsxwriter is not installed"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, PatternFill
+        from openpyxl.utils import get_column_letter
+        
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = sheet_name
+        
+        for idx, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(idx)].width = width
+        
+        # Header row
+        worksheet.append(list(display_df.columns))
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="0052CC", end_color="0052CC", fill_type="solid")
+        for cell in worksheet[1]:
+            cell.font = header_font
+            cell.fill = header_fill
+        
+        # Data rows; dates keep the same yyyy-mm-dd format as the xlsxwriter path
+        is_blank = DataExporter._is_blank
+        for values in display_df.itertuples(index=False, name=None):
+            worksheet.append([None if is_blank(value) else value for value in values])
+        
+        for col_idx, date_col in enumerate(display_df.columns, start=1):
+            if pd.api.types.is_datetime64_any_dtype(display_df[date_col]):
+                for (cell,) in worksheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
+                    cell.number_format = 'yyyy-mm-dd'
+        
+        # Key columns link to their Jira URLs (openpyxl columns are 1-indexed)
+        for col_idx, urls in link_columns.items():
+            for row_idx, url in enumerate(urls, start=2):
+                cell = worksheet.cell(row=row_idx, column=col_idx + 1)
+                if url and cell.value:
+                    cell.hyperlink = url
+                    cell.style = 'Hyperlink'
+        
+        workbook.save(output)
+    
     @staticmethod
     def to_csv(df: pd.DataFrame, include_index: bool = False) -> str:
         """
@@ -146,6 +215,23 @@ class DataExporter:
         Returns:
             CSV string
             
+        Raises:
+            ExportError: If export fails
+        """
+        return DataExporter.to_csv_bytes(df, include_index).decode('utf-8')
+    
+    @staticmethod
+    def to_csv_bytes(df: pd.DataFrame, include_index: bool = False) -> bytes:
+        """
+        Export DataFrame to UTF-8 encoded CSV
+        
+        Args:
+            df: DataFrame to export
+            include_index: Whether to include index in CSV
+            
+        Returns:
+            CSV bytes
+            
         Raises:
             ExportError: If export fails
         """
@@ -153,9 +239,9 @@ class DataExporter:
             if df.empty:
                 raise ExportError("Cannot export empty DataFrame")
             
-            csv_string = df.to_csv(index=include_index, encoding='utf-8')
+            csv_bytes = df.to_csv(index=include_index).encode('utf-8')
             logger.info(f"Successfully exported {len(df)} rows to CSV")
-            return csv_string
+            return csv_bytes
             
         except Exception as e:
             logger.error(f"CSV export failed: {str(e)}")
@@ -183,7 +269,7 @@ class DataExporter:
             extension = '.' + extension
         
         # Sanitize base name
-        safe_name = ''.join(c for c in base_name if c.isalnum() or c in ['-', '_'])
+        safe_name = _FILENAME_RE.sub('', base_name)
         
         if include_timestamp:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
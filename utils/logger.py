@@ -3,70 +3,118 @@ Logging Configuration Module
 Provides centralized logging setup with color support
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from datetime import datetime
-import colorlog
+from typing import Optional, Tuple
+
+# Daily log files kept besides the current one
+LOG_BACKUP_DAYS = 7
+
+# Background thread that writes queued records to the real handlers, and
+# the (level, log_to_file) it was set up with. Streamlit reruns the app
+# script, and with it setup_logging, on every interaction in every session,
+# so repeat calls with the same settings leave this in place
+_listener: Optional[QueueListener] = None
+_listener_config: Optional[Tuple[str, bool]] = None
+_setup_lock = threading.Lock()
+
+
+def _stop_listener(listener: Optional[QueueListener]):
+    """Flush and stop a queue listener and close its handlers"""
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(lambda: _stop_listener(_listener))
 
 
 def setup_logging(log_level: str = "INFO", log_to_file: bool = True):
     """
-    Configure application logging
+    Configure application logging (once per process and settings)
+    
+    Records are put on a queue by the root logger and written to the
+    console and log file by a background listener thread, so callers never
+    wait on I/O. The file rotates at midnight. Calling again with the same
+    settings does nothing.
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_to_file: Whether to log to file
     """
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
-    # Create formatters
-    console_formatter = colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-    
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(numeric_level)
+    global _listener, _listener_config
     
-    # Remove existing handlers
-    root_logger.handlers = []
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(numeric_level)
-    console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
-    
-    # File handler (optional)
-    if log_to_file:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+    with _setup_lock:
+        if _listener is not None and _listener_config == (log_level, log_to_file):
+            return
+        
+        # Only needed once logging is configured, so importing utils stays cheap
+        import colorlog
+        
+        numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+        
+        # Create formatters
+        console_formatter = colorlog.ColoredFormatter(
+            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S',
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+        
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(numeric_level)
+        console_handler.setFormatter(console_formatter)
+        handlers = [console_handler]
+        
+        # File handler (optional)
+        if log_to_file:
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+            
+            file_handler = TimedRotatingFileHandler(
+                log_dir / "app.log", when='midnight', backupCount=LOG_BACKUP_DAYS, encoding='utf-8'
+            )
+            file_handler.setLevel(numeric_level)
+            file_handler.setFormatter(file_formatter)
+            handlers.append(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        
+        # Configure root logger; the handler list is swapped in one step and
+        # the previous listener is stopped afterwards, so records already on
+        # its queue are still written and none are dropped in between
+        root_logger = logging.getLogger()
+        root_logger.setLevel(numeric_level)
+        root_logger.handlers = [QueueHandler(log_queue)]
         
-        log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        previous = _listener
+        _listener, _listener_config = listener, (log_level, log_to_file)
+        _stop_listener(previous)
     
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
     
-    root_logger.info(f"Logging configured: level={log_level}, file={log_to_file}")
+    root_logger.info("Logging configured: level=%s, file=%s", log_level, log_to_file)
 
 
 def get_logger(name: str) -> logging.Logger:
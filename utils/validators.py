@@ -4,7 +4,7 @@ Provides secure input validation functions
 """
 
 import re
-from typing import List, Optional
+from typing import AbstractSet, Collection, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,9 +18,9 @@ class ValidationError(Exception):
 class InputValidator:
     """Secure input validation"""
     
-    # Regex patterns
-    PROJECT_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]{1,9}$')
-    ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]+-\d+$')
+    # Regex patterns, applied with fullmatch; ASCII-only so \d is just 0-9
+    PROJECT_KEY_PATTERN = re.compile(r'[A-Z][A-Z0-9_]{1,9}', re.ASCII)
+    ISSUE_KEY_PATTERN = re.compile(r'[A-Z][A-Z0-9_]+-\d+', re.ASCII)
     
     @staticmethod
     def validate_project_key(project_key: str) -> bool:
@@ -39,7 +39,7 @@ class InputValidator:
         if not project_key:
             raise ValidationError("Project key cannot be empty")
         
-        if not InputValidator.PROJECT_KEY_PATTERN.match(project_key):
+        if not InputValidator.PROJECT_KEY_PATTERN.fullmatch(project_key):
             raise ValidationError(
                 "Invalid project key format. Must be 2-10 uppercase alphanumeric characters."
             )
@@ -63,7 +63,7 @@ class InputValidator:
         if not issue_key:
             raise ValidationError("Issue key cannot be empty")
         
-        if not InputValidator.ISSUE_KEY_PATTERN.match(issue_key):
+        if not InputValidator.ISSUE_KEY_PATTERN.fullmatch(issue_key):
             raise ValidationError(
                 "Invalid issue key format. Must be PROJECT-123 format."
             )
@@ -98,7 +98,7 @@ class InputValidator:
     @staticmethod
     def validate_list_input(
         items: List[str],
-        allowed_values: Optional[List[str]] = None,
+        allowed_values: Optional[Collection[str]] = None,
         min_items: int = 0,
         max_items: int = 100
     ) -> bool:
@@ -107,7 +107,8 @@ class InputValidator:
         
         Args:
             items: List to validate
-            allowed_values: List of allowed values (if None, all values allowed)
+            allowed_values: Allowed values (if None, all values allowed); sets
+                are used as-is, other collections are converted once
             min_items: Minimum number of items required
             max_items: Maximum number of items allowed
             
@@ -127,7 +128,8 @@ class InputValidator:
             raise ValidationError(f"Maximum {max_items} items allowed")
         
         if allowed_values:
-            invalid_items = [item for item in items if item not in allowed_values]
+            allowed = allowed_values if isinstance(allowed_values, AbstractSet) else frozenset(allowed_values)
+            invalid_items = [item for item in items if item not in allowed]
             if invalid_items:
                 raise ValidationError(f"Invalid items: {', '.join(invalid_items)}")
         